@@ -0,0 +1,32 @@
+"""JPPT 애플리케이션 패키지.
+
+자주 사용하는 심볼은 PEP 562 `__getattr__`로 처음 접근할 때 로드합니다.
+`--help`/`--version`처럼 설정이 필요 없는 CLI 경로가 pydantic/yaml/loguru
+import 비용을 지불하지 않도록 하기 위함입니다.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.utils.config import Settings, load_config
+    from src.utils.logger import setup_logger
+
+_LAZY_IMPORTS = {
+    "Settings": "src.utils.config",
+    "load_config": "src.utils.config",
+    "setup_logger": "src.utils.logger",
+}
+
+__all__ = ["Settings", "load_config", "setup_logger"]
+
+
+def __getattr__(name: str) -> Any:
+    """지연 export 대상 심볼을 처음 접근할 때 import합니다."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -5,19 +5,14 @@ start(앱 모드)와 batch(배치 모드) 두 가지 실행 모드를 제공합
 """
 
 import asyncio
-import json
 from importlib.metadata import PackageNotFoundError, version
-from pathlib import Path
-from typing import Any
 
 import typer
-from loguru import logger
-
-from src.utils.config import Settings, load_config
-from src.utils.logger import setup_logger
 
 CLI_NAME = "jppt"
 DIST_NAME = "jppt"
+# 패키지 메타데이터가 없을 때(소스 체크아웃 실행 등) 사용할 버전
+FALLBACK_VERSION = "0.1.0"
 
 # 프로젝트 루트 디렉토리 (src/의 부모 디렉토리)
 app = typer.Typer(
@@ -26,145 +21,17 @@ app = typer.Typer(
     add_completion=False,
 )
 
-_SENSITIVE_CONFIG_KEYS = frozenset(
-    {
-        "access_key",
-        "access_token",
-        "account_no",
-        "account_number",
-        "account_product_code",
-        "api_key",
-        "api_secret",
-        "app_key",
-        "app_secret",
-        "bot_token",
-        "chat_id",
-        "dsn",
-        "product_code",
-        "secret_key",
-    }
-)
-
-
-def _mask_config_secrets(value: Any, *, key: str | None = None) -> Any:
-    """로그에 남기기 전 config secret 값을 마스킹합니다."""
-    if key in _SENSITIVE_CONFIG_KEYS:
-        return "<redacted>"
-    if isinstance(value, dict):
-        return {
-            item_key: _mask_config_secrets(item_value, key=item_key)
-            for item_key, item_value in value.items()
-        }
-    if isinstance(value, list):
-        return [_mask_config_secrets(item) for item in value]
-    return value
-
-
-def _build_config_log_summary(
-    *,
-    mode: str,
-    env: str,
-    settings: Settings,
-    effective_log_level: str,
-    log_file: Path,
-) -> dict[str, Any]:
-    """실행 시작 로그에 남길 config 요약을 생성합니다."""
-    config_values = _mask_config_secrets(settings.model_dump(mode="json"))
-    return {
-        "mode": mode,
-        "env": env,
-        "effective_log_level": effective_log_level,
-        "log_file": str(log_file),
-        **config_values,
-    }
-
-
-def _log_loaded_config(
-    *,
-    mode: str,
-    env: str,
-    settings: Settings,
-    effective_log_level: str,
-    log_file: Path,
-) -> None:
-    """실행 시작 시 핵심 설정 요약을 로깅합니다."""
-    summary = _build_config_log_summary(
-        mode=mode,
-        env=env,
-        settings=settings,
-        effective_log_level=effective_log_level,
-        log_file=log_file,
-    )
-    logger.info(
-        "Loaded config summary:\n{}",
-        json.dumps(summary, ensure_ascii=False, indent=2, sort_keys=True),
-    )
-
-
-def _resolve_log_level(config_level: str, log_level: str | None, verbose: bool) -> str:
-    if verbose:
-        return "DEBUG"
-    if log_level:
-        return log_level.upper()
-    return config_level
-
-
-def _resolve_config_dir(config: str | None) -> Path | None:
-    """CLI config 파일 옵션에서 설정 디렉토리를 추출합니다."""
-    if config is None:
-        return None
-    return Path(config).parent
-
-
-def _load_settings(env: str, config: str | None) -> Settings:
-    """CLI 옵션에 따라 설정을 로드합니다."""
-    config_dir = _resolve_config_dir(config)
-    if config_dir is not None:
-        return load_config(env=env, config_dir=config_dir)
-    return load_config(env=env)
-
-
-def _build_log_file(app_name: str, suffix: str = "") -> Path:
-    """실행 모드별 로그 파일 경로를 생성합니다."""
-    return Path.home() / "logs" / f"{app_name}{suffix}.log"
-
-
-def _configure_runtime(
-    *,
-    mode: str,
-    env: str,
-    settings: Settings,
-    log_level: str | None,
-    verbose: bool,
-    log_suffix: str = "",
-) -> Settings:
-    """로거를 초기화하고 핵심 설정 요약을 남깁니다."""
-    effective_log_level = _resolve_log_level(settings.logging.level, log_level, verbose)
-    log_file = _build_log_file(settings.app.name, log_suffix)
-    setup_logger(
-        level=effective_log_level,
-        log_file=log_file,
-        format_str=settings.logging.format,
-        json_logs=settings.logging.json_logs,
-        rotation=settings.logging.rotation,
-        retention=settings.logging.retention,
-    )
-    _log_loaded_config(
-        mode=mode,
-        env=env,
-        settings=settings,
-        effective_log_level=effective_log_level,
-        log_file=log_file,
-    )
-    return settings
-
 
 def _package_version() -> str:
-    """설치된 패키지 버전을 반환합니다."""
+    """설치된 패키지 버전을 반환합니다.
+
+    설정 파일을 읽지 않고 패키지 메타데이터만 조회하므로 `--version` 경로에서
+    YAML 파싱과 pydantic 검증이 일어나지 않습니다.
+    """
     try:
         return version(DIST_NAME)
     except PackageNotFoundError:
-        return "0.1.0"
+        return FALLBACK_VERSION
 
 
 def version_callback(value: bool) -> None:
@@ -201,12 +68,14 @@ def start(
     주기적인 작업을 수행하거나 신호를 받을 때까지 계속 실행되는 모드입니다.
     Ctrl+C 또는 SIGTERM 신호로 graceful shutdown이 가능합니다.
     """
-    config_dir = _resolve_config_dir(config)
-    settings = _load_settings(env, config)
-    _configure_runtime(
+    from loguru import logger
+
+    from src.utils.bootstrap import bootstrap_runtime, resolve_config_dir
+
+    settings = bootstrap_runtime(
         mode="start",
         env=env,
-        settings=settings,
+        config=config,
         log_level=log_level,
         verbose=verbose,
     )
@@ -222,7 +91,7 @@ def start(
         run_app(
             settings,
             env,
-            config_dir=config_dir,
+            config_dir=resolve_config_dir(config),
             log_level=log_level,
             verbose=verbose,
         )
@@ -241,14 +110,16 @@ def batch(
     작업을 한 번 실행하고 종료하는 모드입니다.
     cron이나 스케줄러에서 주기적으로 호출하기에 적합합니다.
     """
-    settings = _load_settings(env, config)
-    _configure_runtime(
+    from loguru import logger
+
+    from src.utils.bootstrap import bootstrap_runtime
+
+    settings = bootstrap_runtime(
         mode="batch",
         env=env,
-        settings=settings,
+        config=config,
         log_level=log_level,
         verbose=verbose,
-        log_suffix="_batch",
     )
 
     logger.info(f"Starting {settings.app.name} in batch mode")
@@ -0,0 +1,53 @@
+"""공통 유틸리티 패키지.
+
+`from src.utils import HttpClient`처럼 패키지 레벨로 접근하는 심볼은 PEP 562
+`__getattr__`로 처음 접근할 때 해당 서브모듈만 로드합니다. `src.utils.config`
+하나만 필요한 경로가 httpx/telegram 등 다른 유틸리티 의존성을 끌어오지 않도록
+패키지 초기화 시점에는 아무것도 import하지 않습니다.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.utils.config import Settings, load_config
+    from src.utils.http_client import HttpClient
+    from src.utils.logger import setup_logger
+    from src.utils.retry import with_retry, with_retry_async
+    from src.utils.signals import GracefulShutdown, setup_signal_handlers
+    from src.utils.telegram import TelegramNotifier
+
+_LAZY_IMPORTS = {
+    "GracefulShutdown": "src.utils.signals",
+    "HttpClient": "src.utils.http_client",
+    "Settings": "src.utils.config",
+    "TelegramNotifier": "src.utils.telegram",
+    "load_config": "src.utils.config",
+    "setup_logger": "src.utils.logger",
+    "setup_signal_handlers": "src.utils.signals",
+    "with_retry": "src.utils.retry",
+    "with_retry_async": "src.utils.retry",
+}
+
+__all__ = [
+    "GracefulShutdown",
+    "HttpClient",
+    "Settings",
+    "TelegramNotifier",
+    "load_config",
+    "setup_logger",
+    "setup_signal_handlers",
+    "with_retry",
+    "with_retry_async",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """지연 export 대상 심볼을 처음 접근할 때 import합니다."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -3,13 +3,13 @@
 이 모듈은 시그널 처리와 graceful shutdown을 지원하는 앱 모드 실행을 담당합니다.
 """
 
-import asyncio
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Literal
 
 from loguru import logger
 
+from src.utils.bootstrap import build_log_file, resolve_log_level
 from src.utils.config import Settings, TelegramRemoteControlConfig
 from src.utils.logger import setup_logger, validate_logger_config
 from src.utils.reload import ReloadCoordinator, ReloadResult
@@ -20,20 +20,6 @@ from src.utils.telegram_remote import TelegramRemoteController, defer_reload_cle
 _RemoteChangeAction = Literal["stop", "start", "restart", "update"]
 
 
-def _build_log_file(app_name: str) -> Path:
-    """앱 모드 로그 파일 경로를 생성합니다."""
-    return Path.home() / "logs" / f"{app_name}.log"
-
-
-def _resolve_log_level(config_level: str, log_level: str | None, verbose: bool) -> str:
-    """CLI 옵션과 설정 파일을 조합해 최종 로그 레벨을 결정합니다."""
-    if verbose:
-        return "DEBUG"
-    if log_level:
-        return log_level.upper()
-    return config_level
-
-
 def _build_notifier(settings: Settings) -> TelegramNotifier:
     """현재 설정으로 Telegram notifier를 생성합니다."""
     return TelegramNotifier(
@@ -183,7 +169,7 @@ class _PreparedRemoteControllerChange:
         try:
             await self.new_controller.stop()
         except Exception as cleanup_error:  # noqa: BLE001 - 원래 실패를 유지합니다.
-            logger.error(f"Prepared remote controller cleanup failed: {cleanup_error}")
+            logger.error("Prepared remote controller cleanup failed: {}", cleanup_error)
         finally:
             self.new_controller = None
 
@@ -197,12 +183,12 @@ async def _apply_settings_to_runtime(
     verbose: bool,
 ) -> TelegramNotifier:
     """reload된 설정을 remote controller와 logger/notifier에 적용합니다."""
-    effective_log_level = _resolve_log_level(
+    effective_log_level = resolve_log_level(
         next_settings.logging.level,
         log_level,
         verbose,
     )
-    log_file = _build_log_file(next_settings.app.name)
+    log_file = build_log_file(next_settings.app.name)
     validate_logger_config(
         level=effective_log_level,
         log_file=log_file,
@@ -228,7 +214,7 @@ async def _apply_settings_to_runtime(
     except Exception:
         await change.rollback()
         if logger_applied:
-            current_log_level = _resolve_log_level(
+            current_log_level = resolve_log_level(
                 current_settings.logging.level,
                 log_level,
                 verbose,
@@ -236,14 +222,14 @@ async def _apply_settings_to_runtime(
             try:
                 setup_logger(
                     level=current_log_level,
-                    log_file=_build_log_file(current_settings.app.name),
+                    log_file=build_log_file(current_settings.app.name),
                     format_str=current_settings.logging.format,
                     json_logs=current_settings.logging.json_logs,
                     rotation=current_settings.logging.rotation,
                     retention=current_settings.logging.retention,
                 )
             except Exception as restore_error:  # noqa: BLE001 - 원래 실패를 유지합니다.
-                logger.error(f"Logger restore after failed reload failed: {restore_error}")
+                logger.error("Logger restore after failed reload failed: {}", restore_error)
         raise
 
     return next_notifier
@@ -279,10 +265,10 @@ async def run_app(
             async with shutdown:
                 while not shutdown.should_exit:
                     await process_iteration()
-                    await asyncio.sleep(1)
+                    await shutdown.sleep(1)
     """
     logger.info("App mode started")
-    logger.info(f"App: {settings.app.name} v{settings.app.version}")
+    logger.info("App: {} v{}", settings.app.name, settings.app.version)
 
     current_settings = settings
     notifier = _build_notifier(current_settings)
@@ -338,8 +324,8 @@ async def run_app(
             iteration = 0
             while not shutdown.should_exit:
                 iteration += 1
-                logger.debug(f"App iteration {iteration}")
-                await asyncio.sleep(5)  # 실제 로직으로 교체
+                logger.debug("App iteration {}", iteration)
+                await shutdown.sleep(5)  # 실제 로직으로 교체 (종료 시그널 시 즉시 반환)
 
         logger.info("App mode stopped")
         # 정상 종료 알림
@@ -351,10 +337,12 @@ async def run_app(
             )
         )
     except Exception as e:
-        logger.error(f"App crashed: {e}")
+        logger.error("App crashed: {}", e)
         raise
     finally:
+        # async with 진입 전에 실패해도 루프에 죽은 shutdown을 가리키는 핸들러가 남지 않게 합니다.
+        shutdown.restore_signal_handlers()
         try:
             await remote_lifecycle.stop()
         except Exception as e:  # noqa: BLE001 - cleanup 실패는 원래 종료 흐름을 가리지 않습니다.
-            logger.error(f"Remote controller cleanup failed: {e}")
+            logger.error("Remote controller cleanup failed: {}", e)
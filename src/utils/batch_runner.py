@@ -27,7 +27,7 @@ async def run_batch(settings: Settings, env: str) -> None:
             logger.info(f"배치 작업 완료: {result}")
     """
     logger.info("Batch mode started")
-    logger.info(f"App: {settings.app.name} v{settings.app.version}")
+    logger.info("App: {} v{}", settings.app.name, settings.app.version)
 
     # Telegram notifier 초기화
     notifier = TelegramNotifier(
@@ -60,5 +60,5 @@ async def run_batch(settings: Settings, env: str) -> None:
             )
         )
     except Exception as e:
-        logger.error(f"Batch failed: {e}")
+        logger.error("Batch failed: {}", e)
         raise
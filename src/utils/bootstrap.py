@@ -0,0 +1,162 @@
+"""CLI 실행 모드 공통 초기화.
+
+이 모듈은 start/batch 명령이 공유하는 설정 로드, 로그 레벨 결정,
+로거 초기화, 설정 요약 로깅을 한 곳에서 수행합니다.
+CLI 진입점은 명령 본문에서만 이 모듈을 import하여 `--help`/`--version`
+경로에 설정/로깅 의존성이 로드되지 않도록 합니다.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Literal
+
+from loguru import logger
+
+from src.utils.config import Settings, load_config
+from src.utils.logger import setup_logger
+
+RunMode = Literal["start", "batch"]
+
+_SENSITIVE_CONFIG_KEYS = frozenset(
+    {
+        "access_key",
+        "access_token",
+        "account_no",
+        "account_number",
+        "account_product_code",
+        "api_key",
+        "api_secret",
+        "app_key",
+        "app_secret",
+        "bot_token",
+        "chat_id",
+        "dsn",
+        "product_code",
+        "secret_key",
+    }
+)
+
+# 실행 모드별 로그 파일명 접미사
+_LOG_SUFFIXES: dict[RunMode, str] = {"start": "", "batch": "_batch"}
+
+
+def _mask_config_secrets(value: Any, *, key: str | None = None) -> Any:
+    """로그에 남기기 전 config secret 값을 마스킹합니다."""
+    if key in _SENSITIVE_CONFIG_KEYS:
+        return "<redacted>"
+    if isinstance(value, dict):
+        return {
+            item_key: _mask_config_secrets(item_value, key=item_key)
+            for item_key, item_value in value.items()
+        }
+    if isinstance(value, list):
+        return [_mask_config_secrets(item) for item in value]
+    return value
+
+
+def _build_config_log_summary(
+    *,
+    mode: str,
+    env: str,
+    settings: Settings,
+    effective_log_level: str,
+    log_file: Path,
+) -> dict[str, Any]:
+    """실행 시작 로그에 남길 config 요약을 생성합니다."""
+    config_values = _mask_config_secrets(settings.model_dump(mode="json"))
+    return {
+        "mode": mode,
+        "env": env,
+        "effective_log_level": effective_log_level,
+        "log_file": str(log_file),
+        **config_values,
+    }
+
+
+def _log_loaded_config(
+    *,
+    mode: str,
+    env: str,
+    settings: Settings,
+    effective_log_level: str,
+    log_file: Path,
+) -> None:
+    """실행 시작 시 핵심 설정 요약을 로깅합니다."""
+    summary = _build_config_log_summary(
+        mode=mode,
+        env=env,
+        settings=settings,
+        effective_log_level=effective_log_level,
+        log_file=log_file,
+    )
+    logger.info(
+        "Loaded config summary:\n{}",
+        json.dumps(summary, ensure_ascii=False, indent=2, sort_keys=True),
+    )
+
+
+def resolve_log_level(config_level: str, log_level: str | None, verbose: bool) -> str:
+    """CLI 옵션과 설정 파일을 조합해 최종 로그 레벨을 결정합니다."""
+    if verbose:
+        return "DEBUG"
+    if log_level:
+        return log_level.upper()
+    return config_level
+
+
+def resolve_config_dir(config: str | None) -> Path | None:
+    """CLI config 파일 옵션에서 설정 디렉토리를 추출합니다."""
+    if config is None:
+        return None
+    return Path(config).parent
+
+
+def build_log_file(app_name: str, suffix: str = "") -> Path:
+    """실행 모드별 로그 파일 경로를 생성합니다."""
+    return Path.home() / "logs" / f"{app_name}{suffix}.log"
+
+
+def bootstrap_runtime(
+    *,
+    mode: RunMode,
+    env: str,
+    config: str | None,
+    log_level: str | None,
+    verbose: bool,
+) -> Settings:
+    """설정을 로드하고 로거를 초기화한 뒤 핵심 설정 요약을 남깁니다.
+
+    Args:
+        mode: 실행 모드 (start, batch)
+        env: 환경 이름 (dev, prod 등)
+        config: CLI로 전달된 설정 파일 경로
+        log_level: CLI 로그 레벨 override
+        verbose: DEBUG 로그 레벨 강제 여부
+
+    Returns:
+        로드된 설정이 담긴 Settings 객체
+    """
+    config_dir = resolve_config_dir(config)
+    if config_dir is not None:
+        settings = load_config(env=env, config_dir=config_dir)
+    else:
+        settings = load_config(env=env)
+
+    effective_log_level = resolve_log_level(settings.logging.level, log_level, verbose)
+    log_file = build_log_file(settings.app.name, _LOG_SUFFIXES[mode])
+    setup_logger(
+        level=effective_log_level,
+        log_file=log_file,
+        format_str=settings.logging.format,
+        json_logs=settings.logging.json_logs,
+        rotation=settings.logging.rotation,
+        retention=settings.logging.retention,
+    )
+    _log_loaded_config(
+        mode=mode,
+        env=env,
+        settings=settings,
+        effective_log_level=effective_log_level,
+        log_file=log_file,
+    )
+    return settings
@@ -4,8 +4,10 @@
 환경별 설정(dev.yaml, prod.yaml)을 직접 로드하여 사용합니다.
 """
 
+import os
 from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -14,6 +16,12 @@ import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    # libyaml C 바인딩이 있으면 순수 Python 로더보다 수 배 빠르게 파싱합니다.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml 없이 빌드된 PyYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class AppConfig(BaseModel):
     """애플리케이션 기본 설정.
@@ -197,10 +205,76 @@ class Settings(BaseSettings):
     telegram: TelegramConfig = Field(default_factory=TelegramConfig)
 
 
+# 기본 설정 디렉토리 (프로젝트 루트의 config/), 모듈 로드 시 한 번만 계산합니다.
+_DEFAULT_CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+
+# Settings 최상위 필드 이름 (환경변수 override 판정에 사용)
+_SETTINGS_FIELDS = frozenset(Settings.model_fields)
+
+
+def _settings_env_snapshot() -> tuple[tuple[str, str], ...]:
+    """Settings 값에 영향을 주는 환경변수(APP, TELEGRAM__CHAT_ID 등) 스냅샷을 반환합니다."""
+    return tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.lower().split("__", 1)[0] in _SETTINGS_FIELDS
+        )
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_settings(
+    config_file: Path,
+    raw_config: bytes,
+    env_snapshot: tuple[tuple[str, str], ...],
+) -> Settings:
+    """설정 파일 내용으로 Settings를 생성합니다.
+
+    파일 경로, 파일 내용, 환경변수 스냅샷이 모두 같으면 캐시된 결과를 반환하므로
+    YAML 파싱과 pydantic 검증을 다시 수행하지 않습니다. `env_snapshot`은
+    캐시 키로만 사용되며, 실제 환경변수는 Settings가 직접 읽습니다.
+    캐시된 인스턴스는 호출자에게 직접 노출하지 않습니다 (`load_config`가 복사본 반환).
+    """
+    from src.utils.exceptions import ConfigurationError
+
+    config_data: Any = yaml.load(raw_config, Loader=_YamlLoader)
+
+    if config_data is None:
+        config_data = {}
+    elif not isinstance(config_data, Mapping):
+        raise ConfigurationError(f"Config file root must be a mapping: {config_file}")
+
+    return load_config_from_mapping(config_data)
+
+
+def load_config_from_mapping(config_data: Mapping[str, Any]) -> Settings:
+    """이미 파싱된 설정 mapping으로 Settings를 생성합니다.
+
+    YAML 파싱 이후 `load_config`가 수행하는 것과 동일한 검증(pydantic 모델,
+    환경변수 override)을 적용합니다. 결과는 캐시하지 않습니다.
+
+    Args:
+        config_data: YAML 루트와 같은 구조의 설정 mapping
+
+    Returns:
+        생성된 Settings 객체
+    """
+    return Settings(**dict(config_data))
+
+
+def clear_config_cache() -> None:
+    """load_config 결과 캐시를 비웁니다 (테스트용)."""
+    _build_settings.cache_clear()
+
+
 def load_config(env: str = "dev", config_dir: Path | None = None) -> Settings:
     """YAML 파일에서 설정을 로드합니다.
 
     환경별 설정 파일({env}.yaml)을 로드합니다.
+    파일 내용과 관련 환경변수가 이전 호출과 같으면 YAML 파싱과 검증을 건너뛰고
+    캐시된 Settings의 깊은 복사본을 반환합니다. 호출자가 반환값을 수정해도
+    이후 `load_config` 결과에는 영향을 주지 않습니다.
 
     Args:
         env: 환경 이름 (dev, prod 등)
@@ -215,7 +289,7 @@ def load_config(env: str = "dev", config_dir: Path | None = None) -> Settings:
     from src.utils.exceptions import ConfigurationError
 
     if config_dir is None:
-        config_dir = Path(__file__).parent.parent.parent / "config"
+        config_dir = _DEFAULT_CONFIG_DIR
 
     config_file = config_dir / f"{env}.yaml"
 
@@ -225,12 +299,5 @@ def load_config(env: str = "dev", config_dir: Path | None = None) -> Settings:
             f"Please create {env}.yaml from {env}.yaml.example template"
         )
 
-    with config_file.open(encoding="utf-8") as f:
-        config_data: Any = yaml.safe_load(f)
-
-    if config_data is None:
-        config_data = {}
-    elif not isinstance(config_data, Mapping):
-        raise ConfigurationError(f"Config file root must be a mapping: {config_file}")
-
-    return Settings(**dict(config_data))
+    settings = _build_settings(config_file, config_file.read_bytes(), _settings_env_snapshot())
+    return settings.model_copy(deep=True)
@@ -3,13 +3,16 @@
 이 모듈은 타임아웃, 재시도, 에러 처리를 지원하는 비동기 HTTP 클라이언트를 제공합니다.
 """
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import httpx
 from loguru import logger
 
 from src.utils.exceptions import HttpClientError
 
+if TYPE_CHECKING:
+    # httpx는 전송 계층(h11, anyio 등)까지 함께 로드하므로 실제 연결 시점에 import합니다.
+    import httpx
+
 
 class HttpClient:
     """타임아웃 및 재시도를 지원하는 비동기 HTTP 클라이언트.
@@ -21,6 +24,14 @@ class HttpClient:
         async with HttpClient(base_url="https://api.example.com") as client:
             response = await client.get("/endpoint")
             data = response.json()
+
+    여러 HttpClient가 연결 풀(keep-alive 연결)을 공유하려면 애플리케이션에서
+    만든 `httpx.AsyncClient`를 `client`로 전달합니다. 이 경우 컨텍스트 종료 시
+    전달받은 클라이언트를 닫지 않으며, 수명 관리는 생성한 쪽이 담당합니다.
+
+        async with httpx.AsyncClient(base_url="https://api.example.com") as shared:
+            async with HttpClient(client=shared) as client:
+                response = await client.get("/endpoint")
     """
 
     def __init__(
@@ -28,6 +39,11 @@ class HttpClient:
         base_url: str = "",
         timeout: float = 30.0,
         connect_timeout: float = 5.0,
+        client: "httpx.AsyncClient | None" = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = False,
+        transport: "httpx.AsyncBaseTransport | None" = None,
     ) -> None:
         """HTTP 클라이언트를 초기화합니다.
 
@@ -35,27 +51,53 @@ class HttpClient:
             base_url: 모든 요청의 기본 URL
             timeout: 요청 전체 타임아웃 (초)
             connect_timeout: 연결 타임아웃 (초)
+            client: 재사용할 외부 `httpx.AsyncClient` (지정 시 base_url/timeout/연결 풀
+                설정은 해당 클라이언트의 설정을 따름)
+            max_connections: 연결 풀의 최대 동시 연결 수
+            max_keepalive_connections: 재사용을 위해 유지할 최대 keep-alive 연결 수
+            http2: HTTP/2 사용 여부. 한 TCP/TLS 연결로 여러 동시 요청을 다중화하여
+                핸드셰이크 비용을 줄입니다 (`httpx[http2]` 설치 필요)
+            transport: 직접 생성하는 클라이언트에 사용할 전송 계층
+                (테스트에서 `httpx.MockTransport` 등을 주입할 때 사용)
         """
         self.base_url = base_url
         self._client: httpx.AsyncClient | None = None
-        self._timeout = httpx.Timeout(timeout=timeout, connect=connect_timeout)
+        self._shared_client = client
+        self._timeout = timeout
+        self._connect_timeout = connect_timeout
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._http2 = http2
+        self._transport = transport
 
     async def __aenter__(self) -> "HttpClient":
         """비동기 컨텍스트 매니저 진입."""
+        if self._shared_client is not None:
+            self._client = self._shared_client
+            return self
+
+        import httpx
+
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=self._timeout,
+            timeout=httpx.Timeout(timeout=self._timeout, connect=self._connect_timeout),
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_keepalive_connections,
+            ),
+            http2=self._http2,
+            transport=self._transport,
             follow_redirects=True,
         )
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        """비동기 컨텍스트 매니저 종료 및 연결 닫기."""
-        if self._client:
+        """비동기 컨텍스트 매니저 종료 및 직접 생성한 연결 닫기."""
+        if self._client and self._client is not self._shared_client:
             await self._client.aclose()
 
     @staticmethod
-    def _format_http_error(error: httpx.HTTPError) -> str:
+    def _format_http_error(error: "httpx.HTTPError") -> str:
         error_message = str(error).strip()
         error_type = type(error).__name__
         if error_message:
@@ -67,7 +109,7 @@ class HttpClient:
         url: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-    ) -> httpx.Response:
+    ) -> "httpx.Response":
         """GET 요청을 전송합니다.
 
         Args:
@@ -84,14 +126,23 @@ class HttpClient:
         if not self._client:
             raise HttpClientError("Client not initialized. Use 'async with' context manager.")
 
+        import httpx
+
+        # 값이 있는 인자만 전달하여 httpx의 기본값 병합 처리를 건너뜁니다.
+        request_kwargs: dict[str, Any] = {}
+        if params is not None:
+            request_kwargs["params"] = params
+        if headers is not None:
+            request_kwargs["headers"] = headers
+
         try:
-            logger.debug(f"GET {url} params={params}")
-            response = await self._client.get(url, params=params, headers=headers)
+            logger.debug("GET {} params={}", url, params)
+            response = await self._client.get(url, **request_kwargs)
             response.raise_for_status()
             return response
         except httpx.HTTPError as e:
             error_message = self._format_http_error(e)
-            logger.error(f"HTTP GET failed: {url} - {error_message}")
+            logger.error("HTTP GET failed: {} - {}", url, error_message)
             raise HttpClientError(f"HTTP GET failed: {error_message}") from e
 
     async def post(
@@ -100,7 +151,7 @@ class HttpClient:
         json: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-    ) -> httpx.Response:
+    ) -> "httpx.Response":
         """POST 요청을 전송합니다.
 
         Args:
@@ -118,9 +169,19 @@ class HttpClient:
         if not self._client:
             raise HttpClientError("Client not initialized. Use 'async with' context manager.")
 
+        import httpx
+
+        request_kwargs: dict[str, Any] = {}
+        if json is not None:
+            request_kwargs["json"] = json
+        if data is not None:
+            request_kwargs["data"] = data
+        if headers is not None:
+            request_kwargs["headers"] = headers
+
         try:
-            logger.debug(f"POST {url}")
-            response = await self._client.post(url, json=json, data=data, headers=headers)
+            logger.debug("POST {}", url)
+            response = await self._client.post(url, **request_kwargs)
             response.raise_for_status()
             return response
         except httpx.HTTPStatusError as e:
@@ -128,14 +189,14 @@ class HttpClient:
             response_text = e.response.text.strip()
             if response_text:
                 logger.error(
-                    f"HTTP POST failed: {url} - {error_message} - response={response_text}"
+                    "HTTP POST failed: {} - {} - response={}", url, error_message, response_text
                 )
                 raise HttpClientError(
                     f"HTTP POST failed: {error_message} - response={response_text}"
                 ) from e
-            logger.error(f"HTTP POST failed: {url} - {error_message}")
+            logger.error("HTTP POST failed: {} - {}", url, error_message)
             raise HttpClientError(f"HTTP POST failed: {error_message}") from e
         except httpx.HTTPError as e:
             error_message = self._format_http_error(e)
-            logger.error(f"HTTP POST failed: {url} - {error_message}")
+            logger.error("HTTP POST failed: {} - {}", url, error_message)
             raise HttpClientError(f"HTTP POST failed: {error_message}") from e
@@ -4,6 +4,7 @@
 로테이션 시 백업 파일은 .log_YYYYMMDD 형식으로 저장됩니다.
 """
 
+import contextlib
 import os
 import re
 import sys
@@ -14,6 +15,22 @@ from pathlib import Path
 
 from loguru import logger
 
+# setup_logger가 추가한 핸들러 ID ("console", "file")
+_HANDLER_IDS: dict[str, int] = {}
+# 현재 파일 핸들러의 설정 (동일하면 핸들러를 재사용)
+_file_handler_config: tuple[Path, str, str, str, str, bool] | None = None
+# Loguru가 import 시 추가하는 기본 stderr 핸들러 ID
+_DEFAULT_HANDLER_ID = 0
+# 쓰기 가능함을 확인한 로그 디렉토리
+_writable_dirs: set[Path] = set()
+
+# Loguru 기본 백업 파일명 (app.2026-02-06_00-00-00_000000.log)
+_ROTATED_NAME_RE = re.compile(
+    r"^(?P<prefix>.+?)\.(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})_"
+    r"\d{2}-\d{2}-\d{2}_\d+(?P<suffix>\.[^.]+)?$"
+)
+_RETENTION_RE = re.compile(r"(\d+)\s*(day|days|week|weeks)")
+
 
 def _build_console_format(format_str: str, json_logs: bool) -> str:
     """콘솔 로그 포맷에 컬러 태그를 안전하게 적용합니다."""
@@ -35,6 +52,8 @@ def _resolve_log_file_path(log_file: Path) -> Path:
     fallback = Path(tempfile.gettempdir()) / "jppt_logs" / log_file.name
 
     def _can_write(path: Path) -> bool:
+        if path.parent in _writable_dirs:
+            return True
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
             with tempfile.NamedTemporaryFile(
@@ -45,9 +64,10 @@ def _resolve_log_file_path(log_file: Path) -> Path:
                 delete=True,
             ):
                 pass
-            return True
         except OSError:
             return False
+        _writable_dirs.add(path.parent)
+        return True
 
     if _can_write(primary):
         return primary
@@ -64,11 +84,7 @@ def _log_namer(filepath: str) -> str:
     변환 결과: app.log_20260206
     """
     path = Path(filepath)
-    match = re.match(
-        r"^(?P<prefix>.+?)\.(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})_"
-        r"\d{2}-\d{2}-\d{2}_\d+(?P<suffix>\.[^.]+)?$",
-        path.name,
-    )
+    match = _ROTATED_NAME_RE.match(path.name)
     if not match:
         return filepath
 
@@ -83,7 +99,7 @@ def _log_namer(filepath: str) -> str:
 
 def _parse_retention_days(retention: str) -> int:
     """retention 문자열을 일(day) 단위로 파싱합니다."""
-    match = re.match(r"(\d+)\s*(day|days|week|weeks)", retention.strip())
+    match = _RETENTION_RE.match(retention.strip())
     if not match:
         return 10
     value = int(match.group(1))
@@ -101,10 +117,12 @@ def _make_retention_handler(retention: str, log_file: Path) -> Callable[[list[st
     2. 이전에 이름변경된 파일 포함, 보관기간 초과 파일 삭제
     """
     max_age_days = _parse_retention_days(retention)
-    log_name = log_file.name
-    legacy_stem = log_file.stem
-    legacy_ext = log_file.suffix
     log_dir = log_file.parent
+    # 백업 파일명 패턴은 핸들러 생성 시 한 번만 컴파일합니다.
+    backup_matchers = (
+        re.compile(rf"^{re.escape(log_file.name)}_(\d{{8}})$").match,
+        re.compile(rf"^{re.escape(log_file.stem)}_(\d{{8}}){re.escape(log_file.suffix)}$").match,
+    )
 
     def handler(logs: list[str]) -> None:
         now = datetime.now()
@@ -120,25 +138,29 @@ def _make_retention_handler(retention: str, log_file: Path) -> Callable[[list[st
                     os.rename(log_path, new_path)
 
         # 2. 이름변경된 파일(.log_YYYYMMDD) 중 보관기간 초과 파일 삭제
-        backup_patterns = [
-            re.compile(rf"^{re.escape(log_name)}_(\d{{8}})$"),
-            re.compile(rf"^{re.escape(legacy_stem)}_(\d{{8}}){re.escape(legacy_ext)}$"),
-        ]
-        if log_dir.exists():
-            for f in log_dir.iterdir():
+        #    scandir은 디렉토리를 읽을 때 항목 이름을 함께 받아 항목별 Path 생성을 피합니다.
+        try:
+            entries = os.scandir(log_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
                 match = None
-                for pattern in backup_patterns:
-                    match = pattern.match(f.name)
+                for backup_match in backup_matchers:
+                    match = backup_match(entry.name)
                     if match:
                         break
                 if not match:
                     continue
+                stamp = match.group(1)
                 try:
-                    file_date = datetime.strptime(match.group(1), "%Y%m%d")
-                    if file_date < cutoff:
-                        f.unlink(missing_ok=True)
+                    # 고정 8자리 형식이므로 strptime 대신 정수 슬라이싱으로 파싱합니다.
+                    file_date = datetime(int(stamp[:4]), int(stamp[4:6]), int(stamp[6:]))
                 except ValueError:
                     continue
+                if file_date < cutoff:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(entry.path)
 
     return handler
 
@@ -195,6 +217,22 @@ def validate_logger_config(
                     logger.remove(handler_id)
 
 
+def _remove_tracked_handler(name: str) -> bool:
+    """setup_logger가 추가한 핸들러를 제거합니다 (외부에서 이미 제거된 경우 무시).
+
+    Returns:
+        제거 시점에 핸들러가 아직 등록되어 있었는지 여부
+    """
+    handler_id = _HANDLER_IDS.pop(name, None)
+    if handler_id is None:
+        return False
+    try:
+        logger.remove(handler_id)
+    except ValueError:
+        return False
+    return True
+
+
 def setup_logger(
     level: str = "INFO",
     log_file: Path | None = None,
@@ -211,6 +249,11 @@ def setup_logger(
     콘솔 출력은 색상이 적용되며, 파일 로깅은 자동 로테이션을 지원합니다.
     로테이션 시 백업 파일은 {filename}_YYYYMMDD 형식으로 저장됩니다.
 
+    다시 호출하면 이전에 추가한 핸들러만 교체하며(다른 곳에서 추가한 핸들러는
+    유지), 파일 핸들러 설정이 같으면 기존 파일 핸들러(로테이션 상태 포함)를
+    그대로 유지합니다. 외부에서 `logger.remove()`로 핸들러가 지워졌다면 같은
+    인자로 다시 호출해도 콘솔/파일 핸들러를 새로 추가합니다.
+
     Args:
         level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: 로그 파일 경로 (옵션, None이면 파일 로깅 비활성화)
@@ -218,12 +261,19 @@ def setup_logger(
         rotation: 로그 파일 로테이션 주기 (시간 또는 크기, 예: "00:00", "100 MB")
         retention: 로그 파일 보관 기간 (예: "10 days", "1 week")
     """
-    # 기본 핸들러 제거 (깨끗한 상태로 시작)
-    logger.remove()
+    global _file_handler_config
+
+    if not _HANDLER_IDS:
+        # 첫 설정: Loguru 기본 핸들러만 제거 (중복 콘솔 출력 방지, 이미 없으면 무시)
+        with contextlib.suppress(ValueError):
+            logger.remove(_DEFAULT_HANDLER_ID)
+    # 추적 중인 콘솔 핸들러가 이미 없으면 외부에서 logger.remove()가 호출된 것으로 보고
+    # 파일 핸들러도 다시 추가합니다.
+    handlers_intact = _remove_tracked_handler("console")
     console_format = _build_console_format(format_str, json_logs)
 
     # 콘솔 핸들러 추가 (색상, backtrace, diagnose 활성화)
-    logger.add(
+    _HANDLER_IDS["console"] = logger.add(
         sys.stderr,
         format=console_format,
         level=level,
@@ -247,22 +297,31 @@ def setup_logger(
             )
             log_file = resolved_log_file
 
-        try:
-            logger.add(
-                log_file,
-                format=format_str,
-                level=level,
-                rotation=rotation,
-                retention=_make_retention_handler(retention, log_file),
-                compression=None,
-                backtrace=True,
-                diagnose=True,
-                serialize=json_logs,
-            )
-        except OSError as exc:
-            logger.warning(
-                "Failed to configure file logger (%s). Continuing with console only.",
-                exc,
-            )
+        file_config = (log_file, level, format_str, rotation, retention, json_logs)
+        reuse_file_handler = (
+            handlers_intact and file_config == _file_handler_config and "file" in _HANDLER_IDS
+        )
+
+        if not reuse_file_handler:
+            _remove_tracked_handler("file")
+            _file_handler_config = None
+            try:
+                _HANDLER_IDS["file"] = logger.add(
+                    log_file,
+                    format=format_str,
+                    level=level,
+                    rotation=rotation,
+                    retention=_make_retention_handler(retention, log_file),
+                    compression=None,
+                    backtrace=True,
+                    diagnose=True,
+                    serialize=json_logs,
+                )
+                _file_handler_config = file_config
+            except OSError as exc:
+                logger.warning(
+                    "Failed to configure file logger (%s). Continuing with console only.",
+                    exc,
+                )
 
     logger.info(f"Logger initialized: level={level}, file={log_file}")
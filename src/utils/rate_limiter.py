@@ -0,0 +1,65 @@
+"""비동기 rate limiter.
+
+이 모듈은 일정 시간 창(window) 안의 호출 횟수를 제한하는 슬라이딩 윈도우
+rate limiter를 제공합니다. 텔레그램 Bot API의 전송 한도(전체 초당 30건,
+채팅별 분당 20건)처럼 외부 API 호출량을 한도 이하로 유지할 때 사용합니다.
+"""
+
+import asyncio
+from collections import deque
+from time import monotonic
+from typing import Any
+
+
+class AsyncRateLimiter:
+    """슬라이딩 윈도우 방식의 비동기 rate limiter.
+
+    최근 `time_period`초 동안 허용된 호출 시각을 기록하고, 한도에 도달하면
+    가장 오래된 호출이 창을 벗어날 때까지 대기합니다. 이벤트 루프 안에서
+    확인과 기록 사이에 await가 없으므로 별도의 lock 없이 동작합니다.
+
+    사용 예시:
+        limiter = AsyncRateLimiter(max_rate=30, time_period=1.0)
+        async with limiter:
+            await bot.send_message(...)
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 1.0) -> None:
+        """rate limiter를 초기화합니다.
+
+        Args:
+            max_rate: `time_period` 동안 허용할 최대 호출 수
+            time_period: 호출 수를 세는 시간 창 (초)
+        """
+        if max_rate < 1:
+            raise ValueError("max_rate must be at least 1")
+        if time_period <= 0:
+            raise ValueError("time_period must be positive")
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._timestamps: deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        """시간 창을 벗어난 호출 기록을 제거합니다."""
+        while self._timestamps and now - self._timestamps[0] >= self.time_period:
+            self._timestamps.popleft()
+
+    async def acquire(self) -> None:
+        """호출 한도에 여유가 생길 때까지 대기한 뒤 호출 1건을 기록합니다."""
+        while True:
+            now = monotonic()
+            self._prune(now)
+            if len(self._timestamps) < self.max_rate:
+                self._timestamps.append(now)
+                return
+            await asyncio.sleep(self.time_period - (now - self._timestamps[0]))
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        """호출 허용을 받을 때까지 대기합니다."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """호출 기록은 진입 시점에 남기므로 종료 시 할 일이 없습니다."""
+        return None
@@ -1,40 +1,62 @@
-"""tenacity를 사용한 재시도 데코레이터.
+"""지수 백오프를 사용하는 재시도 데코레이터.
 
 이 모듈은 실패한 함수 호출을 자동으로 재시도하는 데코레이터를 제공합니다.
 지수 백오프(exponential backoff)를 사용하여 재시도 간격을 점진적으로 늘립니다.
+첫 시도가 성공하는 일반 경로는 함수 호출 한 번과 try 블록 하나로 끝나며,
+재시도 상태 객체를 호출마다 생성하지 않습니다. 대기 시간 목록은 데코레이트
+시점에 한 번만 계산합니다.
 """
 
-from collections.abc import Callable
+import asyncio
+import inspect
+import time
+from collections.abc import Awaitable, Callable
 from functools import wraps
-from typing import Any, TypeVar
+from typing import Any, NoReturn, TypeVar, cast
 
 from loguru import logger
-from tenacity import (
-    RetryError,
-    Retrying,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 from src.utils.exceptions import RetryExhaustedError
 
 T = TypeVar("T")
 
+ExceptionTypes = type[Exception] | tuple[type[Exception], ...]
+
+
+def _backoff_delays(
+    max_attempts: int, wait_seconds: float, max_wait_seconds: float
+) -> tuple[float, ...]:
+    """실패한 시도마다 대기할 시간 목록을 계산합니다 (마지막 시도 후에는 대기하지 않음)."""
+    return tuple(
+        min(wait_seconds * 2**retry_index, max_wait_seconds)
+        for retry_index in range(max_attempts - 1)
+    )
+
+
+def _raise_retry_exhausted(func_name: str, max_attempts: int, error: Exception) -> NoReturn:
+    """재시도 소진을 로깅하고 원본 예외를 감싼 RetryExhaustedError를 발생시킵니다."""
+    logger.error(f"Retry exhausted for {func_name} after {max_attempts} attempts: {error}")
+    raise RetryExhaustedError(f"Failed after {max_attempts} attempts: {error}") from error
+
 
 def with_retry(
     max_attempts: int = 3,
     wait_seconds: float = 1.0,
     max_wait_seconds: float = 10.0,
+    retry_on: ExceptionTypes = Exception,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """지수 백오프를 사용하는 재시도 데코레이터.
 
     함수 실행에 실패하면 지정된 횟수만큼 자동으로 재시도합니다.
     재시도 간격은 지수적으로 증가하며 최대 대기 시간을 초과하지 않습니다.
+    코루틴 함수에 적용하면 `with_retry_async`와 동일하게 `asyncio.sleep`으로
+    대기하여 이벤트 루프를 막지 않습니다.
 
     Args:
         max_attempts: 최대 재시도 횟수
         wait_seconds: 초기 재시도 대기 시간 (초)
         max_wait_seconds: 최대 재시도 대기 시간 (초)
+        retry_on: 재시도할 예외 타입 (그 외 예외는 재시도 없이 그대로 전파)
 
     Returns:
         실패 시 재시도하는 데코레이트된 함수
@@ -43,40 +65,77 @@ def with_retry(
         RetryExhaustedError: 모든 재시도 횟수가 소진된 경우
     """
 
+    delays = _backoff_delays(max_attempts, wait_seconds, max_wait_seconds)
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(func):
+            async_decorator = with_retry_async(
+                max_attempts, wait_seconds, max_wait_seconds, retry_on=retry_on
+            )
+            return cast(Callable[..., T], async_decorator(func))
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            result: T | None = None
+            # max_attempts가 1 미만이면 한 번도 실행하지 않습니다.
+            if max_attempts < 1:
+                raise RetryExhaustedError(f"Unexpected end of retry logic for {func.__name__}")
+            for delay in delays:
+                try:
+                    return func(*args, **kwargs)
+                except retry_on:
+                    time.sleep(delay)
+            try:
+                return func(*args, **kwargs)
+            except retry_on as e:
+                _raise_retry_exhausted(func.__name__, max_attempts, e)
+
+        return wrapper
+
+    return decorator
+
+
+def with_retry_async(
+    max_attempts: int = 3,
+    wait_seconds: float = 1.0,
+    max_wait_seconds: float = 10.0,
+    retry_on: ExceptionTypes = Exception,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """비동기 함수용 지수 백오프 재시도 데코레이터.
+
+    `with_retry`와 동일한 재시도 규칙을 사용하지만, 대기 시 `asyncio.sleep`을
+    사용하여 이벤트 루프를 막지 않습니다. HttpClient 호출처럼 I/O 중심의
+    코루틴에 사용합니다.
+
+    Args:
+        max_attempts: 최대 재시도 횟수
+        wait_seconds: 초기 재시도 대기 시간 (초)
+        max_wait_seconds: 최대 재시도 대기 시간 (초)
+        retry_on: 재시도할 예외 타입 (그 외 예외는 재시도 없이 그대로 전파)
+
+    Returns:
+        실패 시 재시도하는 데코레이트된 코루틴 함수
+
+    Raises:
+        RetryExhaustedError: 모든 재시도 횟수가 소진된 경우
+    """
+
+    delays = _backoff_delays(max_attempts, wait_seconds, max_wait_seconds)
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            # max_attempts가 1 미만이면 한 번도 실행하지 않습니다.
+            if max_attempts < 1:
+                raise RetryExhaustedError(f"Unexpected end of retry logic for {func.__name__}")
+            for delay in delays:
+                try:
+                    return await func(*args, **kwargs)
+                except retry_on:
+                    await asyncio.sleep(delay)
             try:
-                # tenacity의 Retrying 컨텍스트 매니저 사용
-                for attempt in Retrying(
-                    stop=stop_after_attempt(max_attempts),
-                    wait=wait_exponential(
-                        multiplier=wait_seconds,
-                        max=max_wait_seconds,
-                    ),
-                ):
-                    with attempt:
-                        result = func(*args, **kwargs)
-                        return result
-            except RetryError as e:
-                # RetryError에서 원본 예외 추출
-                original_error = e.last_attempt.exception()
-                logger.error(
-                    f"Retry exhausted for {func.__name__} "
-                    f"after {max_attempts} attempts: {original_error}"
-                )
-                raise RetryExhaustedError(
-                    f"Failed after {max_attempts} attempts: {original_error}"
-                ) from original_error
-            except Exception as e:
-                # 기타 예외 처리 및 래핑
-                logger.error(
-                    f"Retry exhausted for {func.__name__} after {max_attempts} attempts: {e}"
-                )
-                raise RetryExhaustedError(f"Failed after {max_attempts} attempts: {e}") from e
-            # 여기에 도달하면 안 되지만 mypy 만족을 위해 추가
-            raise RetryExhaustedError(f"Unexpected end of retry logic for {func.__name__}")
+                return await func(*args, **kwargs)
+            except retry_on as e:
+                _raise_retry_exhausted(func.__name__, max_attempts, e)
 
         return wrapper
 
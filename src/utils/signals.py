@@ -4,18 +4,24 @@
 정리(cleanup) 콜백을 등록하여 종료 시 리소스를 안전하게 해제할 수 있습니다.
 """
 
+import asyncio
 import signal
+import sys
+import threading
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 from loguru import logger
 
+_SHUTDOWN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
 
 class GracefulShutdown:
     """SIGTERM/SIGINT 시그널에 대한 graceful shutdown 처리.
 
     비동기 컨텍스트 매니저로 사용하며, 종료 시그널을 받으면
-    등록된 정리 콜백을 순서대로 실행합니다.
+    등록된 정리 콜백을 동시에 실행합니다 (전체 소요 시간은 가장 느린 콜백 기준). 컨텍스트를 벗어나면
+    `setup_signal_handlers`로 등록한 시그널 핸들러를 이전 상태로 되돌립니다.
 
     사용 예시:
         shutdown = GracefulShutdown()
@@ -24,12 +30,26 @@ class GracefulShutdown:
         async with shutdown:
             while not shutdown.should_exit:
                 await do_work()
+                await shutdown.sleep(5)
     """
 
-    def __init__(self) -> None:
-        """Graceful shutdown 핸들러를 초기화합니다."""
-        self.should_exit = False  # 종료 플래그
+    def __init__(self, cleanup_timeout: float | None = None) -> None:
+        """Graceful shutdown 핸들러를 초기화합니다.
+
+        Args:
+            cleanup_timeout: 정리 콜백 전체에 허용할 최대 시간 (초, None이면 제한 없음)
+        """
+        self._cleanup_timeout = cleanup_timeout
+        # 종료 요청 이벤트 (루프에는 처음 wait할 때 바인딩됨)
+        self._exit_event = asyncio.Event()
         self._cleanup_callbacks: list[Callable[[], Awaitable[None]]] = []  # 정리 콜백 목록
+        self._signal_loop: asyncio.AbstractEventLoop | None = None  # 핸들러를 등록한 루프
+        self._previous_handlers: dict[signal.Signals, Any] = {}  # 핸들러 등록 전 핸들러
+
+    @property
+    def should_exit(self) -> bool:
+        """종료 시그널을 받았는지 여부."""
+        return self._exit_event.is_set()
 
     def register_cleanup(self, callback: Callable[[], Awaitable[None]]) -> None:
         """종료 시 실행할 정리 콜백을 등록합니다.
@@ -42,31 +62,122 @@ class GracefulShutdown:
     def _handle_signal(self, signum: int, frame: Any) -> None:
         """종료 시그널을 처리합니다."""
         logger.info(f"Received signal {signum}, initiating graceful shutdown")
-        self.should_exit = True
+        self._exit_event.set()
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """종료 시그널을 받을 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무기한)
+
+        Returns:
+            종료 시그널을 받았으면 True, 시간 초과면 False
+        """
+        try:
+            await asyncio.wait_for(self._exit_event.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def sleep(self, seconds: float) -> None:
+        """지정한 시간만큼 대기하되, 종료 시그널을 받으면 즉시 반환합니다.
+
+        메인 루프의 `asyncio.sleep` 대신 사용하면 종료 지연이 대기 시간만큼
+        늘어나지 않습니다.
+
+        Args:
+            seconds: 최대 대기 시간 (초)
+        """
+        await self.wait(seconds)
 
     async def __aenter__(self) -> "GracefulShutdown":
         """컨텍스트 매니저 진입."""
         return self
 
+    def restore_signal_handlers(self) -> None:
+        """`setup_signal_handlers`로 등록한 시그널 핸들러를 해제하고 이전 핸들러를 복원합니다.
+
+        이벤트 루프의 `remove_signal_handler`는 기본 핸들러(SIG_DFL 등)를 설치하므로,
+        루프 핸들러를 해제한 뒤 등록 전에 기록한 핸들러를 다시 설치합니다.
+        여러 번 호출해도 안전합니다.
+        """
+        if self._signal_loop is not None:
+            if not self._signal_loop.is_closed():
+                for sig in _SHUTDOWN_SIGNALS:
+                    self._signal_loop.remove_signal_handler(sig)
+            self._signal_loop = None
+
+        for sig, previous in self._previous_handlers.items():
+            # Python 밖에서 설치된 핸들러는 getsignal이 None을 반환하며 다시 설치할 수 없습니다.
+            if previous is not None:
+                signal.signal(sig, previous)
+        self._previous_handlers.clear()
+
+    async def _run_cleanup_callbacks(self) -> None:
+        """등록된 정리 콜백을 동시에 실행하고, 실패한 콜백은 로깅만 합니다."""
+        results = await asyncio.gather(
+            *(callback() for callback in self._cleanup_callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            # 내부 작업 시간 초과 등으로 끝난 CancelledError(BaseException)도 기록합니다.
+            if isinstance(result, BaseException):
+                logger.error("Cleanup callback failed: {!r}", result)
+
     async def __aexit__(self, *args: Any) -> None:
-        """컨텍스트 매니저 종료 및 정리 콜백 실행."""
-        if self.should_exit:
-            logger.info("Running cleanup callbacks")
-            for callback in self._cleanup_callbacks:
+        """컨텍스트 매니저 종료, 정리 콜백 실행 및 시그널 핸들러 복원."""
+        try:
+            if self.should_exit:
+                logger.info("Running cleanup callbacks")
                 try:
-                    await callback()
-                except Exception as e:
-                    logger.error(f"Cleanup callback failed: {e}")
+                    await asyncio.wait_for(self._run_cleanup_callbacks(), self._cleanup_timeout)
+                except TimeoutError:
+                    logger.error("Cleanup callbacks timed out after {}s", self._cleanup_timeout)
+        finally:
+            self.restore_signal_handlers()
 
 
 def setup_signal_handlers(shutdown: GracefulShutdown) -> None:
     """Graceful shutdown을 위한 시그널 핸들러를 설정합니다.
 
     SIGTERM과 SIGINT 시그널을 받으면 shutdown 인스턴스의 플래그를 설정합니다.
+    실행 중인 이벤트 루프가 있으면 `loop.add_signal_handler`로 등록하여
+    핸들러가 루프 안에서 실행되고 대기 중인 `shutdown.sleep`을 즉시 깨우게 합니다.
+    루프가 없거나 지원하지 않는 플랫폼(Windows)에서는 `signal.signal`을 사용합니다.
+    등록한 핸들러는 shutdown 컨텍스트 종료 시 해제되어 이전 핸들러가 복원됩니다.
+    시그널 핸들러는 메인 스레드에서만 등록할 수 있으므로, 다른 스레드에서 호출하면
+    경고만 남기고 등록을 건너뜁니다 (종료는 `_handle_signal` 직접 호출로 요청).
 
     Args:
         shutdown: 시그널을 처리할 GracefulShutdown 인스턴스
     """
-    signal.signal(signal.SIGTERM, shutdown._handle_signal)
-    signal.signal(signal.SIGINT, shutdown._handle_signal)
+    if threading.current_thread() is not threading.main_thread():
+        logger.warning("Signal handlers skipped (not running in the main thread)")
+        return
+
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    for sig in _SHUTDOWN_SIGNALS:
+        shutdown._previous_handlers.setdefault(sig, signal.getsignal(sig))
+
+    if loop is not None and sys.platform != "win32":
+        registered: list[signal.Signals] = []
+        try:
+            for sig in _SHUTDOWN_SIGNALS:
+                loop.add_signal_handler(sig, shutdown._handle_signal, sig, None)
+                registered.append(sig)
+        except NotImplementedError:
+            # 일부만 등록된 상태로 signal.signal 경로와 섞이지 않도록 먼저 되돌립니다.
+            for sig in registered:
+                loop.remove_signal_handler(sig)
+        else:
+            shutdown._signal_loop = loop
+            logger.info("Signal handlers registered on event loop (SIGTERM, SIGINT)")
+            return
+
+    for sig in _SHUTDOWN_SIGNALS:
+        signal.signal(sig, shutdown._handle_signal)
     logger.info("Signal handlers registered (SIGTERM, SIGINT)")
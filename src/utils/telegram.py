@@ -3,15 +3,36 @@
 이 모듈은 텔레그램 봇을 통해 메시지를 전송하는 기능을 제공합니다.
 """
 
+import asyncio
+import contextlib
+import warnings
 from collections.abc import Callable
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
+from typing import TYPE_CHECKING, ClassVar
+from weakref import WeakValueDictionary
 from zoneinfo import ZoneInfo
 
 from loguru import logger
-from telegram import Bot
-from telegram.error import TimedOut
 
 from src.utils.config import TelegramSilentTimeConfig
+from src.utils.rate_limiter import AsyncRateLimiter
+
+if TYPE_CHECKING:
+    # python-telegram-bot은 import 비용이 크므로 알림이 활성화된 경우에만 로드합니다.
+    from telegram import Bot
+    from telegram.error import RetryAfter
+
+# 텔레그램 Bot API 전송 한도: 봇 전체 초당 30건, 그룹 채팅별 분당 20건
+# (1:1 채팅은 초당 1건 수준까지 허용되므로 `PRIVATE_CHAT_RATE`를 지정할 수 있음)
+_GLOBAL_RATE = (30, 1.0)
+_PER_CHAT_RATE = (20, 60.0)
+# 텔레그램 메시지 최대 길이 및 묶음 전송 구분자
+_MAX_MESSAGE_LENGTH = 4096
+_BATCH_SEPARATOR = "\n---\n"
+
+# 같은 토큰의 notifier가 Bot(내부 httpx 연결 풀)을 공유하도록 토큰별로 보관합니다.
+# 약한 참조이므로 마지막 notifier가 사라지면 Bot도 함께 해제됩니다.
+_BOT_CACHE: "WeakValueDictionary[str, Bot]" = WeakValueDictionary()
 
 
 class TelegramNotifier:
@@ -19,12 +40,32 @@ class TelegramNotifier:
 
     봇 토큰과 채팅 ID를 사용하여 메시지를 전송합니다.
     알림이 비활성화되어 있거나 전송에 실패해도 애플리케이션을 중단하지 않습니다.
+    전송은 모든 인스턴스가 공유하는 rate limiter(봇 전체 및 채팅별)를 거치며,
+    텔레그램이 `RetryAfter`로 응답하면 지정된 시간만큼 기다린 뒤 한 번 재전송합니다.
+    채팅별 한도 기본값은 그룹 채팅 기준(분당 20건)입니다. 1:1 채팅에는
+    `per_chat_rate=TelegramNotifier.PRIVATE_CHAT_RATE`를 지정하면 더 빠르게
+    보낼 수 있습니다. 같은 채팅방의 limiter는 공유되므로 처음 생성한 인스턴스의
+    `per_chat_rate`가 적용됩니다.
 
     사용 예시:
         notifier = TelegramNotifier(bot_token="xxx", chat_id="yyy", enabled=True)
         await notifier.send_message("안녕하세요!")
+
+    이벤트가 몰릴 수 있는 알림은 `queue_message`로 큐에 넣으면 `batch_window`초
+    안에 들어온 메시지를 하나로 묶어 전송합니다. 백그라운드 전송 작업은 큐가 비면
+    스스로 종료되며, `async with` 블록을 벗어나거나 `flush`를 호출하면 남은
+    메시지를 모두 보낸 뒤 반환합니다:
+
+        async with TelegramNotifier(bot_token="xxx", chat_id="yyy") as notifier:
+            notifier.queue_message("event 1")
+            notifier.queue_message("event 2")
     """
 
+    PRIVATE_CHAT_RATE: ClassVar[tuple[int, float]] = (1, 1.0)
+
+    _global_limiter: ClassVar[AsyncRateLimiter] = AsyncRateLimiter(*_GLOBAL_RATE)
+    _chat_limiters: ClassVar[dict[str, AsyncRateLimiter]] = {}
+
     def __init__(
         self,
         bot_token: str,
@@ -32,6 +73,9 @@ class TelegramNotifier:
         enabled: bool = True,
         silent_time: TelegramSilentTimeConfig | None = None,
         now_provider: Callable[[], datetime] | None = None,
+        batch_window: float = 0.5,
+        max_batch_size: int = 20,
+        per_chat_rate: tuple[int, float] = _PER_CHAT_RATE,
     ) -> None:
         """텔레그램 알림 전송기를 초기화합니다.
 
@@ -41,19 +85,94 @@ class TelegramNotifier:
             enabled: 알림 활성화 여부
             silent_time: 무음 시간 설정
             now_provider: 현재 시각 주입 함수 (테스트용)
+            batch_window: `queue_message` 메시지를 묶을 대기 시간 (초)
+            max_batch_size: 한 번에 묶어 보낼 최대 메시지 수
+            per_chat_rate: 채팅방별 전송 한도 (최대 건수, 시간 창 초)
         """
         self.enabled = enabled
         self.chat_id = chat_id
+        self._bot_token = bot_token
+        # Bot은 첫 전송 시점에 생성합니다 (메시지를 보내지 않는 실행은 생성 비용이 없음).
         self._bot: Bot | None = None
         self._silent_time = silent_time or TelegramSilentTimeConfig()
         self._now_provider = now_provider or self._default_now_provider
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._per_chat_rate = per_chat_rate
+        self._queue: asyncio.Queue[str] | None = None
+        self._drain_task: asyncio.Task[None] | None = None
 
         if enabled and bot_token:
-            self._bot = Bot(token=bot_token)
             logger.info(f"Telegram notifier initialized: chat_id={chat_id}")
         elif enabled:
             logger.warning("Telegram enabled but bot_token is empty")
 
+    async def __aenter__(self) -> "TelegramNotifier":
+        """비동기 컨텍스트 매니저 진입."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """비동기 컨텍스트 매니저 종료 시 큐에 남은 메시지를 전송합니다."""
+        await self.flush()
+
+    def _get_bot(self) -> "Bot":
+        """텔레그램 Bot을 처음 필요할 때 가져옵니다 (같은 토큰의 Bot은 공유)."""
+        if self._bot is None:
+            bot = _BOT_CACHE.get(self._bot_token)
+            if bot is None:
+                import telegram
+
+                bot = telegram.Bot(token=self._bot_token)
+                _BOT_CACHE[self._bot_token] = bot
+            self._bot = bot
+        return self._bot
+
+    def _chat_limiter(self) -> AsyncRateLimiter:
+        """현재 채팅방의 공유 rate limiter를 반환합니다."""
+        limiter = self._chat_limiters.get(self.chat_id)
+        if limiter is None:
+            limiter = AsyncRateLimiter(*self._per_chat_rate)
+            self._chat_limiters[self.chat_id] = limiter
+        return limiter
+
+    @staticmethod
+    def _retry_after_seconds(error: "RetryAfter") -> float:
+        """RetryAfter 예외의 대기 시간을 초 단위로 반환합니다."""
+        with warnings.catch_warnings():
+            # python-telegram-bot v22.2+: int 값 접근 시 timedelta 전환 예고 경고가 발생합니다.
+            warnings.simplefilter("ignore", DeprecationWarning)
+            retry_after = error.retry_after
+        if isinstance(retry_after, timedelta):
+            return retry_after.total_seconds()
+        return float(retry_after)
+
+    async def _send_limited(self, message: str, parse_mode: str | None) -> None:
+        """봇 전체/채팅별 rate limit을 지키며 메시지를 한 번 전송합니다.
+
+        채팅별 한도를 먼저 기다린 뒤 전체 한도를 얻습니다. 반대 순서면 한도에 걸린
+        채팅이 전체 한도 슬롯을 잡은 채 대기하여 다른 채팅의 전송까지 늦춥니다.
+        """
+        async with self._chat_limiter(), self._global_limiter:
+            await self._get_bot().send_message(
+                chat_id=self.chat_id,
+                text=message,
+                parse_mode=parse_mode,
+            )
+
+    async def _send(self, message: str, parse_mode: str | None) -> None:
+        """메시지를 전송하고, RetryAfter 응답 시 지정된 시간 후 한 번 재전송합니다."""
+        from telegram.error import RetryAfter
+
+        try:
+            await self._send_limited(message, parse_mode)
+        except RetryAfter as e:
+            delay = self._retry_after_seconds(e)
+            logger.warning(
+                "Telegram flood control for chat_id={}, retrying in {}s", self.chat_id, delay
+            )
+            await asyncio.sleep(delay)
+            await self._send_limited(message, parse_mode)
+
     def _default_now_provider(self) -> datetime:
         """설정된 타임존 기준 현재 시각을 반환합니다."""
         return datetime.now(ZoneInfo(self._silent_time.timezone))
@@ -130,7 +249,7 @@ class TelegramNotifier:
             전송 실패 시에도 예외를 발생시키지 않습니다.
             알림은 애플리케이션 동작을 방해해서는 안 되기 때문입니다.
         """
-        if not self.enabled or not self._bot:
+        if not self.enabled or not self._bot_token:
             logger.debug("Telegram notification skipped (disabled)")
             return False
         if self._is_silent_time():
@@ -143,12 +262,10 @@ class TelegramNotifier:
             )
             return False
 
+        from telegram.error import TimedOut
+
         try:
-            await self._bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=parse_mode,
-            )
+            await self._send(message, parse_mode)
             logger.info("Telegram message sent to {} message=\n{}", self.chat_id, message)
             return True
         except TimedOut:
@@ -164,3 +281,75 @@ class TelegramNotifier:
             logger.error(f"Failed to send Telegram message: {e}")
             # 예외를 발생시키지 않음 - 알림 실패가 앱을 중단해서는 안 됨
             return False
+
+    def queue_message(self, message: str) -> None:
+        """메시지를 묶음 전송 큐에 넣습니다.
+
+        첫 메시지가 들어오면 백그라운드 전송 작업을 시작하며, `batch_window`초
+        동안 추가로 들어온 메시지를 구분자로 이어 붙여 한 번에 전송합니다.
+        실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+        Args:
+            message: 전송할 메시지 텍스트
+        """
+        if not self.enabled or not self._bot_token:
+            logger.debug("Telegram notification skipped (disabled)")
+            return
+
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._queue.put_nowait(message)
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_queue(self._queue))
+
+    async def _collect_batch(
+        self, queue: asyncio.Queue[str], first: str
+    ) -> tuple[list[str], str | None]:
+        """첫 메시지 이후 batch_window 동안 들어온 메시지를 길이 한도 안에서 모읍니다.
+
+        Returns:
+            묶인 메시지 목록과, 길이 한도를 넘어 다음 묶음으로 넘길 메시지
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._batch_window
+        batch = [first]
+        length = len(first)
+
+        while len(batch) < self._max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                break
+            length += len(_BATCH_SEPARATOR) + len(message)
+            if length > _MAX_MESSAGE_LENGTH:
+                return batch, message
+            batch.append(message)
+
+        return batch, None
+
+    async def _drain_queue(self, queue: asyncio.Queue[str]) -> None:
+        """큐에 쌓인 메시지를 묶어서 전송하는 백그라운드 작업 (큐가 비면 종료)."""
+        carry: str | None = None
+        while carry is not None or not queue.empty():
+            first = carry if carry is not None else queue.get_nowait()
+            batch, carry = await self._collect_batch(queue, first)
+            try:
+                await self.send_message(_BATCH_SEPARATOR.join(batch))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush(self) -> None:
+        """큐에 남은 메시지를 모두 전송하고 백그라운드 전송 작업을 정리합니다."""
+        if self._queue is None:
+            return
+
+        await self._queue.join()
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._drain_task
+            self._drain_task = None
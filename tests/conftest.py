@@ -1,11 +1,73 @@
 """Pytest configuration and shared fixtures."""
 
+import shutil
+import subprocess
+import sys
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.utils.config import Settings
+from src.utils.config import Settings, load_config
+
+if TYPE_CHECKING:
+    from typer.testing import CliRunner
+
+_PROJECT_ROOT = Path(__file__).parent.parent
+_EXAMPLE_DEV_CONFIG = _PROJECT_ROOT / "config" / "dev.yaml.example"
+
+_TEMP_DEV_CONFIG_YAML = """
+app:
+  name: "test"
+  version: "0.1.0"
+  debug: false
+
+logging:
+  level: "INFO"
+  format: "{time} | {level} | {message}"
+  json_logs: false
+  rotation: "00:00"
+  retention: "10 days"
+
+telegram:
+  enabled: false
+  bot_token: ""
+  chat_id: ""
+"""
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> "CliRunner":
+    """Typer CLI runner shared across the test session (stderr is kept separate)."""
+    from typer.testing import CliRunner
+
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def assert_not_imported() -> Callable[[str, Iterable[str]], None]:
+    """Run `code` in a fresh interpreter and assert `modules` (or submodules) stay unloaded."""
+
+    def check(code: str, modules: Iterable[str]) -> None:
+        script = (
+            f"import sys\n{code}\n"
+            f"modules = {tuple(modules)!r}\n"
+            "print(sorted(name for name in sys.modules "
+            "if any(name == m or name.startswith(m + '.') for m in modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=_PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    return check
 
 
 @pytest.fixture
@@ -28,6 +90,16 @@ def config() -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def mock_settings() -> Settings:
+    """Settings shared across the session as a load_config return value (read-only)."""
+    return Settings(
+        app={"name": "test-app", "version": "0.1.0", "debug": True},
+        logging={"level": "INFO", "json_logs": False},
+        telegram={"enabled": False},
+    )
+
+
 @pytest.fixture
 def mock_telegram() -> MagicMock:
     """Mock Telegram notifier."""
@@ -51,26 +123,14 @@ def temp_config_dir(tmp_path: Path) -> Path:
     config_dir = tmp_path / "config"
     config_dir.mkdir()
 
-    dev_file = config_dir / "dev.yaml"
-    dev_file.write_text(
-        """
-app:
-  name: "test"
-  version: "0.1.0"
-  debug: false
+    (config_dir / "dev.yaml").write_text(_TEMP_DEV_CONFIG_YAML)
 
-logging:
-  level: "INFO"
-  format: "{time} | {level} | {message}"
-  json_logs: false
-  rotation: "00:00"
-  retention: "10 days"
+    return config_dir
 
-telegram:
-  enabled: false
-  bot_token: ""
-  chat_id: ""
-"""
-    )
 
-    return config_dir
+@pytest.fixture(scope="session")
+def default_dev_config(tmp_path_factory: pytest.TempPathFactory) -> Settings:
+    """Settings loaded once per session from config/dev.yaml.example (read-only)."""
+    config_dir = tmp_path_factory.mktemp("default_config")
+    shutil.copyfile(_EXAMPLE_DEV_CONFIG, config_dir / "dev.yaml")
+    return load_config(env="dev", config_dir=config_dir)
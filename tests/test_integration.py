@@ -1,31 +1,36 @@
 """Integration tests for the full application."""
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
-from typer.testing import CliRunner
 
-from main import app
+from src.main import app
 
-runner = CliRunner()
+if TYPE_CHECKING:
+    from typer.testing import CliRunner
 
 
-def test_full_cli_integration(temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_full_cli_integration(
+    temp_config_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    cli_runner: "CliRunner",
+) -> None:
     """Test full CLI workflow with config."""
     _ = (temp_config_dir, monkeypatch)
 
     from src.utils.config import Settings
 
-    with patch("main.load_config") as mock_load_config:
+    with patch("src.utils.config.load_config") as mock_load_config:
         mock_load_config.return_value = Settings(
             app={"name": "test-app", "version": "0.1.0", "debug": False}
         )
-        result = runner.invoke(app, ["--version"])
+        result = cli_runner.invoke(app, ["--version"])
         assert result.exit_code == 0
 
     # Test help
-    result = runner.invoke(app, ["--help"])
+    result = cli_runner.invoke(app, ["--help"])
     assert result.exit_code == 0
     assert "start" in result.stdout
     assert "batch" in result.stdout
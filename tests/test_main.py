@@ -1,156 +1,158 @@
 """Test CLI entry point."""
 
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
 from importlib.metadata import PackageNotFoundError
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
+import pytest
 
-from src.main import CLI_NAME, app
+from src.main import CLI_NAME, FALLBACK_VERSION, app, batch, start
+from src.utils.config import Settings
 
-runner = CliRunner()
+if TYPE_CHECKING:
+    from typer.testing import CliRunner
 
 
-def _capture_coroutine(mock_asyncio_run: AsyncMock):
+def _capture_coroutine(mock_asyncio_run: MagicMock):
     """asyncio.run에 전달된 코루틴을 반환하고 테스트 종료 시 닫도록 합니다."""
     coroutine = mock_asyncio_run.call_args.args[0]
     assert coroutine.cr_frame is not None
     return coroutine
 
 
-def test_cli_version() -> None:
+@pytest.fixture
+def plain_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Rich가 색상/터미널 기능 감지 없이 일반 텍스트로 도움말을 렌더링하도록 합니다."""
+    monkeypatch.setenv("NO_COLOR", "1")
+    monkeypatch.setenv("TERM", "dumb")
+
+
+@pytest.fixture
+def cli_mocks(mock_settings: Settings) -> Iterator[SimpleNamespace]:
+    """start/batch 실행 경로의 asyncio.run, setup_logger, load_config를 한 번에 대체합니다."""
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            run=stack.enter_context(patch("src.main.asyncio.run")),
+            setup_logger=stack.enter_context(patch("src.utils.bootstrap.setup_logger")),
+            load_config=stack.enter_context(
+                patch("src.utils.bootstrap.load_config", return_value=mock_settings)
+            ),
+        )
+
+
+def test_cli_version(cli_runner: "CliRunner") -> None:
     """Test --version flag."""
     with (
-        patch("src.main.load_config", side_effect=AssertionError("load_config should not run")),
+        patch(
+            "src.utils.bootstrap.bootstrap_runtime",
+            side_effect=AssertionError("bootstrap_runtime should not run"),
+        ),
         patch("src.main.version", return_value="9.9.9"),
     ):
-        result = runner.invoke(app, ["--version"])
+        result = cli_runner.invoke(app, ["--version"])
 
     assert result.exit_code == 0
     assert result.stdout.strip() == f"{CLI_NAME} version 9.9.9"
 
 
-def test_cli_version_uses_fallback_when_package_metadata_is_missing() -> None:
+def test_cli_version_uses_fallback_when_package_metadata_is_missing(
+    cli_runner: "CliRunner",
+) -> None:
     """Test --version fallback without installed package metadata."""
     with (
-        patch("src.main.load_config", side_effect=AssertionError("load_config should not run")),
+        patch(
+            "src.utils.bootstrap.bootstrap_runtime",
+            side_effect=AssertionError("bootstrap_runtime should not run"),
+        ),
         patch("src.main.version", side_effect=PackageNotFoundError),
     ):
-        result = runner.invoke(app, ["--version"])
+        result = cli_runner.invoke(app, ["--version"])
 
     assert result.exit_code == 0
-    assert result.stdout.strip() == f"{CLI_NAME} version 0.1.0"
+    assert result.stdout.strip() == f"{CLI_NAME} version {FALLBACK_VERSION}"
+
 
+def test_cli_version_does_not_load_config_dependencies(
+    assert_not_imported: Callable[[str, Iterable[str]], None],
+) -> None:
+    """--version은 설정 로더와 YAML/pydantic을 import하지 않아야 한다."""
+    assert_not_imported(
+        "from typer.testing import CliRunner; import src.main; "
+        "result = CliRunner().invoke(src.main.app, ['--version']); "
+        "assert result.exit_code == 0, result.output",
+        ("src.utils.config", "pydantic", "yaml"),
+    )
+
+
+def test_cli_import_defers_runtime_dependencies(
+    assert_not_imported: Callable[[str, Iterable[str]], None],
+) -> None:
+    """CLI 모듈 import만으로 설정/로거 의존성을 로드하지 않아야 한다."""
+    assert_not_imported(
+        "import src.main",
+        ("src.utils.config", "src.utils.logger", "pydantic", "yaml", "loguru"),
+    )
 
-def test_cli_help() -> None:
+
+@pytest.mark.usefixtures("plain_terminal")
+def test_cli_help(cli_runner: "CliRunner") -> None:
     """Test --help flag."""
-    result = runner.invoke(app, ["--help"])
+    result = cli_runner.invoke(app, ["--help"])
     assert result.exit_code == 0
     assert "start" in result.stdout
     assert "batch" in result.stdout
     assert "api" not in result.stdout.lower()
 
 
-def test_start_command_help() -> None:
+@pytest.mark.usefixtures("plain_terminal")
+def test_start_command_help(cli_runner: "CliRunner") -> None:
     """Test start command help."""
-    result = runner.invoke(app, ["start", "--help"])
+    result = cli_runner.invoke(app, ["start", "--help"])
     assert result.exit_code == 0
     assert "데몬" in result.stdout or "장시간" in result.stdout
 
 
-def test_batch_command_help() -> None:
+@pytest.mark.usefixtures("plain_terminal")
+def test_batch_command_help(cli_runner: "CliRunner") -> None:
     """Test batch command help."""
-    result = runner.invoke(app, ["batch", "--help"])
+    result = cli_runner.invoke(app, ["batch", "--help"])
     assert result.exit_code == 0
     assert "일회성" in result.stdout or "배치" in result.stdout
 
 
-@patch("src.main.asyncio.run")
-@patch("src.main.setup_logger")
-@patch("src.main.load_config")
 def test_start_command_basic(
-    mock_load_config: AsyncMock,
-    mock_setup_logger: AsyncMock,
-    mock_asyncio_run: AsyncMock,
+    cli_mocks: SimpleNamespace,
     temp_config_dir: Path,
+    cli_runner: "CliRunner",
 ) -> None:
     """Test start command basic execution."""
-    from src.utils.config import Settings
-
-    mock_load_config.return_value = Settings(
-        app={"name": "test-app", "version": "0.1.0", "debug": True},
-        logging={"level": "DEBUG", "json_logs": False},
-        telegram={"enabled": False},
-    )
-
-    with patch("src.main.logger.info") as mock_logger_info:
-        result = runner.invoke(app, ["start", "--env", "dev"])
+    with patch("src.utils.bootstrap.logger.info") as mock_logger_info:
+        result = cli_runner.invoke(app, ["start", "--env", "dev"])
 
     assert result.exit_code == 0
-    mock_asyncio_run.assert_called_once()
-    call_kwargs = mock_setup_logger.call_args[1]
+    cli_mocks.run.assert_called_once()
+    call_kwargs = cli_mocks.setup_logger.call_args[1]
     assert call_kwargs["json_logs"] is False
     assert any(
         "Loaded config summary" in str(call.args[0]) for call in mock_logger_info.call_args_list
     )
-    coroutine = _capture_coroutine(mock_asyncio_run)
+    coroutine = _capture_coroutine(cli_mocks.run)
     assert coroutine.cr_frame.f_locals["env"] == "dev"
     coroutine.close()
 
 
-def test_loaded_config_summary_includes_runtime_values_and_masks_secrets() -> None:
-    from src.main import _build_config_log_summary
-    from src.utils.config import Settings
-
-    settings = Settings(
-        app={"name": "test-app", "version": "0.1.0", "debug": True},
-        logging={"level": "DEBUG", "json_logs": False},
-        telegram={
-            "enabled": True,
-            "bot_token": "telegram-token",
-            "chat_id": "123456",
-        },
-    )
-
-    summary = _build_config_log_summary(
-        mode="start",
-        env="prod",
-        settings=settings,
-        effective_log_level="INFO",
-        log_file=Path("/tmp/test-app.log"),
-    )
-
-    assert summary["mode"] == "start"
-    assert summary["env"] == "prod"
-    assert summary["app"]["name"] == "test-app"
-    assert summary["logging"]["level"] == "DEBUG"
-    assert summary["effective_log_level"] == "INFO"
-    assert summary["log_file"] == "/tmp/test-app.log"
-    assert summary["telegram"]["enabled"] is True
-    assert summary["telegram"]["bot_token"] == "<redacted>"
-    assert summary["telegram"]["chat_id"] == "<redacted>"
-
-
-@patch("src.main.asyncio.run")
-@patch("src.main.setup_logger")
-@patch("src.main.load_config")
 def test_start_command_passes_reload_runtime_options(
-    mock_load_config: AsyncMock,
-    mock_setup_logger: AsyncMock,
-    mock_asyncio_run: AsyncMock,
+    cli_mocks: SimpleNamespace,
     temp_config_dir: Path,
+    cli_runner: "CliRunner",
 ) -> None:
     """start 명령은 reload runtime 옵션을 run_app으로 전달해야 합니다."""
-    from src.utils.config import Settings
-
-    mock_load_config.return_value = Settings(
-        app={"name": "test-app", "version": "0.1.0", "debug": True},
-        logging={"level": "INFO", "json_logs": False},
-        telegram={"enabled": False},
-    )
-
     custom_config = temp_config_dir / "custom.yaml"
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         [
             "start",
@@ -165,134 +167,70 @@ def test_start_command_passes_reload_runtime_options(
     )
 
     assert result.exit_code == 0
-    assert mock_load_config.call_args.kwargs["config_dir"] == temp_config_dir
-    coroutine = _capture_coroutine(mock_asyncio_run)
+    assert cli_mocks.load_config.call_args.kwargs["config_dir"] == temp_config_dir
+    coroutine = _capture_coroutine(cli_mocks.run)
     assert coroutine.cr_frame.f_locals["config_dir"] == temp_config_dir
     assert coroutine.cr_frame.f_locals["log_level"] == "ERROR"
     assert coroutine.cr_frame.f_locals["verbose"] is True
     coroutine.close()
 
 
-@patch("src.main.asyncio.run")
-@patch("src.main.setup_logger")
-@patch("src.main.load_config")
 def test_start_command_with_verbose(
-    mock_load_config: AsyncMock, mock_setup_logger: AsyncMock, mock_asyncio_run: AsyncMock
+    cli_mocks: SimpleNamespace,
 ) -> None:
     """verbose flag should force DEBUG logging."""
-    from src.utils.config import Settings
-
-    mock_load_config.return_value = Settings(
-        app={"name": "test-app", "version": "0.1.0", "debug": True},
-        logging={"level": "INFO"},
-        telegram={"enabled": False},
-    )
-
-    mock_asyncio_run.side_effect = lambda coroutine: coroutine.close()
-    result = runner.invoke(app, ["start", "--verbose"])
-    assert result.exit_code == 0
+    cli_mocks.run.side_effect = lambda coroutine: coroutine.close()
+    start(env="dev", config=None, log_level=None, verbose=True)
     # Verify DEBUG level was set due to verbose
-    call_kwargs = mock_setup_logger.call_args[1]
+    call_kwargs = cli_mocks.setup_logger.call_args[1]
     assert call_kwargs["level"] == "DEBUG"
 
 
-@patch("src.main.asyncio.run")
-@patch("src.main.setup_logger")
-@patch("src.main.load_config")
 def test_start_command_uses_cli_log_level_override(
-    mock_load_config: AsyncMock, mock_setup_logger: AsyncMock, mock_asyncio_run: AsyncMock
+    cli_mocks: SimpleNamespace,
 ) -> None:
     """--log-level should override the configured logging level."""
-    from src.utils.config import Settings
-
-    mock_load_config.return_value = Settings(
-        app={"name": "test-app", "version": "0.1.0", "debug": True},
-        logging={"level": "DEBUG"},
-        telegram={"enabled": False},
-    )
-
-    mock_asyncio_run.side_effect = lambda coroutine: coroutine.close()
-    result = runner.invoke(app, ["start", "--log-level", "ERROR"])
-    assert result.exit_code == 0
-    call_kwargs = mock_setup_logger.call_args[1]
+    cli_mocks.run.side_effect = lambda coroutine: coroutine.close()
+    start(env="dev", config=None, log_level="error", verbose=False)
+    call_kwargs = cli_mocks.setup_logger.call_args[1]
     assert call_kwargs["level"] == "ERROR"
 
 
-@patch("src.main.asyncio.run")
-@patch("src.main.setup_logger")
-@patch("src.main.load_config")
 def test_batch_command_basic(
-    mock_load_config: AsyncMock, mock_setup_logger: AsyncMock, mock_asyncio_run: AsyncMock
+    cli_mocks: SimpleNamespace,
+    cli_runner: "CliRunner",
 ) -> None:
     """Test batch command basic execution."""
-    from src.utils.config import Settings
-
-    mock_load_config.return_value = Settings(
-        app={"name": "test-app", "version": "0.1.0", "debug": True},
-        logging={"level": "DEBUG", "json_logs": False},
-        telegram={"enabled": False},
-    )
-
-    result = runner.invoke(app, ["batch", "--env", "dev"])
+    result = cli_runner.invoke(app, ["batch", "--env", "dev"])
     assert result.exit_code == 0
-    mock_asyncio_run.assert_called_once()
-    coroutine = _capture_coroutine(mock_asyncio_run)
+    cli_mocks.run.assert_called_once()
+    coroutine = _capture_coroutine(cli_mocks.run)
     assert coroutine.cr_frame.f_locals["env"] == "dev"
     coroutine.close()
 
 
-@patch("src.main.asyncio.run")
-@patch("src.main.setup_logger")
-@patch("src.main.load_config")
 def test_batch_command_with_custom_config(
-    mock_load_config: AsyncMock,
-    mock_setup_logger: AsyncMock,
-    mock_asyncio_run: AsyncMock,
+    cli_mocks: SimpleNamespace,
     temp_config_dir: Path,
 ) -> None:
     """Test batch command with custom config path."""
-    from src.utils.config import Settings
-
-    mock_load_config.return_value = Settings(
-        app={"name": "test-app", "version": "0.1.0", "debug": True},
-        logging={"level": "DEBUG", "json_logs": False},
-        telegram={"enabled": False},
-    )
-
     custom_config = temp_config_dir / "custom.yaml"
-    mock_asyncio_run.side_effect = lambda coroutine: coroutine.close()
-    result = runner.invoke(app, ["batch", "--config", str(custom_config)])
-    assert result.exit_code == 0
+    cli_mocks.run.side_effect = lambda coroutine: coroutine.close()
+    batch(env="dev", config=str(custom_config), log_level=None, verbose=False)
     # Verify config_dir was passed
-    call_kwargs = mock_load_config.call_args[1]
+    call_kwargs = cli_mocks.load_config.call_args[1]
     assert call_kwargs["config_dir"] == temp_config_dir
 
 
-@patch("src.main.asyncio.run")
-@patch("src.main.setup_logger")
-@patch("src.main.load_config")
 def test_log_file_path_is_in_home_directory(
-    mock_load_config: AsyncMock,
-    mock_setup_logger: AsyncMock,
-    mock_asyncio_run: AsyncMock,
+    cli_mocks: SimpleNamespace,
 ) -> None:
     """Test that log file path is in user's home directory ($HOME/logs)."""
-    from pathlib import Path
-
-    from src.utils.config import Settings
-
-    mock_load_config.return_value = Settings(
-        app={"name": "test-app", "version": "0.1.0", "debug": True},
-        logging={"level": "INFO", "json_logs": False},
-        telegram={"enabled": False},
-    )
-
-    mock_asyncio_run.side_effect = lambda coroutine: coroutine.close()
-    result = runner.invoke(app, ["start"])
-    assert result.exit_code == 0
+    cli_mocks.run.side_effect = lambda coroutine: coroutine.close()
+    start(env="dev", config=None, log_level=None, verbose=False)
 
     # Verify setup_logger was called with path to $HOME/logs
-    call_kwargs = mock_setup_logger.call_args[1]
+    call_kwargs = cli_mocks.setup_logger.call_args[1]
     log_file = call_kwargs["log_file"]
 
     # Log file should be: $HOME / "logs" / "test-app.log"
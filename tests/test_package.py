@@ -0,0 +1,42 @@
+"""Tests for lazy package exports."""
+
+import pkgutil
+from collections.abc import Callable, Iterable
+
+import pytest
+
+import src
+import src.utils
+from src.utils.config import Settings, load_config
+from src.utils.http_client import HttpClient
+from src.utils.logger import setup_logger
+from src.utils.signals import GracefulShutdown
+
+
+def test_package_exports_resolve_lazily() -> None:
+    """패키지 레벨 심볼은 원본 모듈의 객체를 그대로 반환해야 한다."""
+    assert src.Settings is Settings
+    assert src.load_config is load_config
+    assert src.setup_logger is setup_logger
+
+
+def test_package_unknown_attribute_raises() -> None:
+    """지연 export 대상이 아니면 AttributeError를 발생시켜야 한다."""
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        _ = src.missing  # type: ignore[attr-defined]
+
+
+def test_utils_package_exports_resolve_lazily() -> None:
+    """src.utils 패키지 레벨 심볼도 원본 모듈의 객체를 반환해야 한다."""
+    assert src.utils.load_config is load_config
+    assert src.utils.HttpClient is HttpClient
+    assert src.utils.GracefulShutdown is GracefulShutdown
+
+
+def test_utils_package_import_does_not_load_submodules(
+    assert_not_imported: Callable[[str, Iterable[str]], None],
+) -> None:
+    """src.utils import만으로 서브모듈을 로드하지 않아야 한다."""
+    submodules = [f"src.utils.{module.name}" for module in pkgutil.iter_modules(src.utils.__path__)]
+
+    assert_not_imported("import src.utils", submodules)
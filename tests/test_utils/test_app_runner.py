@@ -18,6 +18,7 @@ class _ImmediateShutdown:
     def __init__(self) -> None:
         self.should_exit = True
         self.cleanup_callbacks: list[Callable[[], Awaitable[None]]] = []
+        self.restore_count = 0
 
     def register_cleanup(self, callback: Callable[[], Awaitable[None]]) -> None:
         self.cleanup_callbacks.append(callback)
@@ -28,6 +29,12 @@ class _ImmediateShutdown:
     async def __aexit__(self, *args: object) -> None:
         return None
 
+    async def sleep(self, seconds: float) -> None:
+        del seconds
+
+    def restore_signal_handlers(self) -> None:
+        self.restore_count += 1
+
 
 class _RunningShutdown(_ImmediateShutdown):
     """테스트용 실행 중 shutdown."""
@@ -138,6 +145,30 @@ async def test_run_app_starts_remote_controller_and_registers_cleanup() -> None:
     controller.stop.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_run_app_restores_signal_handlers_when_startup_fails() -> None:
+    """async with shutdown 진입 전에 실패해도 시그널 핸들러를 해제해야 합니다."""
+    settings = _settings(remote_control_enabled=True)
+    shutdown = _ImmediateShutdown()
+    controller = MagicMock()
+    controller.start = AsyncMock(side_effect=RuntimeError("start failed"))
+    controller.stop = AsyncMock()
+
+    with (
+        patch("src.utils.app_runner.GracefulShutdown", return_value=shutdown),
+        patch("src.utils.app_runner.setup_signal_handlers"),
+        patch(
+            "src.utils.app_runner.TelegramNotifier.send_message",
+            new_callable=AsyncMock,
+        ),
+        patch("src.utils.app_runner.TelegramRemoteController", return_value=controller),
+        pytest.raises(RuntimeError, match="start failed"),
+    ):
+        await run_app(settings, "prod")
+
+    assert shutdown.restore_count == 1
+
+
 @pytest.mark.asyncio
 async def test_run_app_does_not_create_remote_controller_when_disabled() -> None:
     """remote_control이 비활성화되면 컨트롤러를 만들지 않습니다."""
@@ -524,7 +555,7 @@ async def test_run_app_exception_stops_remote_controller() -> None:
     with (
         patch("src.utils.app_runner.GracefulShutdown", return_value=shutdown),
         patch("src.utils.app_runner.setup_signal_handlers"),
-        patch("src.utils.app_runner.asyncio.sleep", side_effect=raise_runtime_error),
+        patch.object(shutdown, "sleep", side_effect=raise_runtime_error),
         patch("src.utils.app_runner.TelegramNotifier.send_message", new_callable=AsyncMock),
         patch("src.utils.app_runner.TelegramRemoteController", return_value=controller),
         pytest.raises(RuntimeError, match="loop failed"),
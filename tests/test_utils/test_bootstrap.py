@@ -0,0 +1,73 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.utils.bootstrap import (
+    _build_config_log_summary,
+    bootstrap_runtime,
+    build_log_file,
+    resolve_config_dir,
+    resolve_log_level,
+)
+from src.utils.config import Settings
+
+
+def test_loaded_config_summary_includes_runtime_values_and_masks_secrets() -> None:
+    settings = Settings(
+        app={"name": "test-app", "version": "0.1.0", "debug": True},
+        logging={"level": "DEBUG", "json_logs": False},
+        telegram={
+            "enabled": True,
+            "bot_token": "telegram-token",
+            "chat_id": "123456",
+        },
+    )
+
+    summary = _build_config_log_summary(
+        mode="start",
+        env="prod",
+        settings=settings,
+        effective_log_level="INFO",
+        log_file=Path("/tmp/test-app.log"),
+    )
+
+    assert summary["mode"] == "start"
+    assert summary["env"] == "prod"
+    assert summary["app"]["name"] == "test-app"
+    assert summary["logging"]["level"] == "DEBUG"
+    assert summary["effective_log_level"] == "INFO"
+    assert summary["log_file"] == "/tmp/test-app.log"
+    assert summary["telegram"]["enabled"] is True
+    assert summary["telegram"]["bot_token"] == "<redacted>"
+    assert summary["telegram"]["chat_id"] == "<redacted>"
+
+
+def test_resolve_log_level_prefers_verbose_then_cli_override() -> None:
+    assert resolve_log_level("INFO", "error", verbose=True) == "DEBUG"
+    assert resolve_log_level("INFO", "error", verbose=False) == "ERROR"
+    assert resolve_log_level("INFO", None, verbose=False) == "INFO"
+
+
+def test_resolve_config_dir_uses_config_file_parent() -> None:
+    assert resolve_config_dir(None) is None
+    assert resolve_config_dir("/etc/app/prod.yaml") == Path("/etc/app")
+
+
+@patch("src.utils.bootstrap.setup_logger")
+@patch("src.utils.bootstrap.load_config")
+def test_bootstrap_runtime_uses_batch_log_file(
+    mock_load_config: MagicMock, mock_setup_logger: MagicMock
+) -> None:
+    """batch 모드는 _batch 접미사가 붙은 로그 파일을 사용해야 한다."""
+    mock_load_config.return_value = Settings(app={"name": "test-app"})
+
+    settings = bootstrap_runtime(
+        mode="batch",
+        env="dev",
+        config=None,
+        log_level=None,
+        verbose=False,
+    )
+
+    assert settings is mock_load_config.return_value
+    mock_load_config.assert_called_once_with(env="dev")
+    assert mock_setup_logger.call_args.kwargs["log_file"] == build_log_file("test-app", "_batch")
@@ -1,26 +1,59 @@
 """Tests for configuration management."""
 
+import re
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 
-from src.utils.config import Settings, load_config
+from src.utils.config import (
+    Settings,
+    clear_config_cache,
+    load_config,
+    load_config_from_mapping,
+)
 from src.utils.exceptions import ConfigurationError
 
-
-def test_load_config_default(tmp_path: Path) -> None:
+_TELEGRAM_ENABLED = {"enabled": True, "bot_token": "token", "chat_id": "chat"}
+
+
+def _silent_time(*, enabled: bool) -> dict[str, object]:
+    """알 수 없는 타임존을 가진 silent time 설정을 생성합니다."""
+    return {"enabled": enabled, "start": "23:00", "end": "08:00", "timezone": "Invalid/Timezone"}
+
+
+def _remote_control_config(
+    *,
+    telegram_enabled: bool = True,
+    bot_token: str = "token",
+    allowed_chat_ids: list[object] | None = None,
+    commands: dict[str, bool] | None = None,
+) -> dict[str, object]:
+    """원격제어가 켜진 설정 mapping을 생성합니다."""
+    remote_control: dict[str, object] = {
+        "enabled": True,
+        "allowed_chat_ids": ["12345"] if allowed_chat_ids is None else allowed_chat_ids,
+    }
+    if commands is not None:
+        remote_control["commands"] = commands
+    return {
+        "telegram": {
+            "enabled": telegram_enabled,
+            "bot_token": bot_token,
+            "chat_id": "12345",
+            "remote_control": remote_control,
+        }
+    }
+
+
+def test_load_config_default(default_dev_config: Settings) -> None:
     """Test loading default configuration."""
     config_path = Path(__file__).parent.parent.parent / "config" / "dev.yaml.example"
-    config_dir = tmp_path
-    temp_config = config_dir / "dev.yaml"
-    temp_config.write_text(config_path.read_text(encoding="utf-8"), encoding="utf-8")
     expected = yaml.safe_load(config_path.read_text(encoding="utf-8"))["app"]
 
-    config = load_config(env="dev", config_dir=config_dir)
-
-    assert config.app.name == expected["name"]
-    assert config.app.version == expected["version"]
+    assert default_dev_config.app.name == expected["name"]
+    assert default_dev_config.app.version == expected["version"]
 
 
 def test_settings_default_values() -> None:
@@ -32,27 +65,21 @@ def test_settings_default_values() -> None:
     assert not hasattr(settings, "api")
 
 
-def test_load_config_complete(tmp_path: Path) -> None:
+def test_load_config_complete() -> None:
     """Test loading complete environment config."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-app:
-  name: "test"
-  debug: true
-logging:
-  level: "DEBUG"
-  format: "test format"
-  json_logs: false
-  rotation: "00:00"
-  retention: "10 days"
-telegram:
-  enabled: false
-  bot_token: ""
-  chat_id: ""
-"""
+    config = load_config_from_mapping(
+        {
+            "app": {"name": "test", "debug": True},
+            "logging": {
+                "level": "DEBUG",
+                "format": "test format",
+                "json_logs": False,
+                "rotation": "00:00",
+                "retention": "10 days",
+            },
+            "telegram": {"enabled": False, "bot_token": "", "chat_id": ""},
+        }
     )
-
-    config = load_config(env="dev", config_dir=tmp_path)
     assert config.app.debug is True
     assert config.logging.level == "DEBUG"
     assert config.logging.json_logs is False
@@ -81,84 +108,46 @@ def test_load_config_rejects_non_mapping_root(tmp_path: Path) -> None:
         load_config(env="dev", config_dir=tmp_path)
 
 
-def test_load_config_with_telegram_silent_time(tmp_path: Path) -> None:
+def test_load_config_with_telegram_silent_time() -> None:
     """텔레그램 silent time 설정을 로드해야 한다."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-telegram:
-  enabled: true
-  bot_token: "token"
-  chat_id: "chat"
-  silent_time:
-    enabled: true
-    start: "22:30"
-"""
+    config = load_config_from_mapping(
+        {
+            "telegram": {
+                **_TELEGRAM_ENABLED,
+                "silent_time": {"enabled": True, "start": "22:30"},
+            }
+        }
     )
 
-    config = load_config(env="dev", config_dir=tmp_path)
-
     assert config.telegram.silent_time.enabled is True
     assert config.telegram.silent_time.start == "22:30"
     assert config.telegram.silent_time.end == "08:00"
     assert config.telegram.silent_time.timezone == "Asia/Seoul"
 
 
-def test_load_config_has_no_telegram_templates_field(tmp_path: Path) -> None:
+def test_load_config_has_no_telegram_templates_field() -> None:
     """텔레그램 템플릿 설정 필드를 제공하지 않아야 한다."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-telegram:
-  enabled: true
-  bot_token: "token"
-  chat_id: "chat"
-"""
-    )
-
-    config = load_config(env="dev", config_dir=tmp_path)
+    config = load_config_from_mapping({"telegram": _TELEGRAM_ENABLED})
 
     assert not hasattr(config.telegram, "templates")
 
 
-def test_load_config_allows_unknown_timezone_when_silent_time_disabled(tmp_path: Path) -> None:
+def test_load_config_allows_unknown_timezone_when_silent_time_disabled() -> None:
     """silent time이 비활성화면 타임존 검증을 건너뛰어야 한다."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-telegram:
-  enabled: true
-  bot_token: "token"
-  chat_id: "chat"
-  silent_time:
-    enabled: false
-    start: "23:00"
-    end: "08:00"
-    timezone: "Invalid/Timezone"
-"""
+    config = load_config_from_mapping(
+        {"telegram": {**_TELEGRAM_ENABLED, "silent_time": _silent_time(enabled=False)}}
     )
 
-    config = load_config(env="dev", config_dir=tmp_path)
-
     assert config.telegram.silent_time.enabled is False
     assert config.telegram.silent_time.timezone == "Invalid/Timezone"
 
 
-def test_load_config_rejects_unknown_timezone_when_silent_time_enabled(tmp_path: Path) -> None:
+def test_load_config_rejects_unknown_timezone_when_silent_time_enabled() -> None:
     """silent time이 활성화면 유효한 타임존이어야 한다."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-telegram:
-  enabled: true
-  bot_token: "token"
-  chat_id: "chat"
-  silent_time:
-    enabled: true
-    start: "23:00"
-    end: "08:00"
-    timezone: "Invalid/Timezone"
-"""
-    )
-
     with pytest.raises(ValueError, match="Timezone must be a valid IANA timezone"):
-        load_config(env="dev", config_dir=tmp_path)
+        load_config_from_mapping(
+            {"telegram": {**_TELEGRAM_ENABLED, "silent_time": _silent_time(enabled=True)}}
+        )
 
 
 def test_remote_control_defaults_disabled() -> None:
@@ -202,56 +191,18 @@ telegram:
     assert config.telegram.remote_control.commands.help is True
 
 
-def test_remote_control_requires_allowed_chat_ids(tmp_path: Path) -> None:
+def test_remote_control_requires_allowed_chat_ids() -> None:
     """원격제어가 켜져 있으면 allowed_chat_ids가 비어 있으면 안 된다."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-telegram:
-  enabled: true
-  bot_token: "token"
-  chat_id: "12345"
-  remote_control:
-    enabled: true
-    allowed_chat_ids: []
-""",
-        encoding="utf-8",
-    )
-
     with pytest.raises(
         ValueError,
         match="remote_control.allowed_chat_ids must not be empty when enabled",
     ):
-        load_config(env="dev", config_dir=tmp_path)
-
-
-def test_remote_control_rejects_boolean_allowed_chat_ids(tmp_path: Path) -> None:
-    """allowed_chat_ids에 boolean 값은 허용하지 않아야 한다."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-telegram:
-  enabled: true
-  bot_token: "token"
-  chat_id: "12345"
-  remote_control:
-    enabled: true
-    allowed_chat_ids: true
-""",
-        encoding="utf-8",
-    )
-
-    with pytest.raises(
-        ValueError,
-        match="allowed_chat_ids must be a list of chat ids",
-    ):
-        load_config(env="dev", config_dir=tmp_path)
+        load_config_from_mapping(_remote_control_config(allowed_chat_ids=[]))
 
 
-@pytest.mark.parametrize("allowed_chat_ids", ["null", '""'])
-def test_remote_control_rejects_invalid_allowed_chat_ids_scalar(
-    tmp_path: Path,
-    allowed_chat_ids: str,
-) -> None:
-    """allowed_chat_ids scalar 값은 유효한 chat id만 허용해야 한다."""
+@pytest.mark.parametrize("allowed_chat_ids", ["true", "null", '""'])
+def test_load_config_rejects_scalar_allowed_chat_ids(tmp_path: Path, allowed_chat_ids: str) -> None:
+    """YAML에서 allowed_chat_ids가 boolean/null/빈 문자열 scalar이면 거부해야 한다."""
     (tmp_path / "dev.yaml").write_text(
         f"""
 telegram:
@@ -272,95 +223,101 @@ telegram:
         load_config(env="dev", config_dir=tmp_path)
 
 
-@pytest.mark.parametrize("allowed_chat_ids", ["[true]", "[null]", '[""]'])
+@pytest.mark.parametrize("allowed_chat_ids", [[True], [None], [""]])
 def test_remote_control_rejects_invalid_allowed_chat_ids_list_item(
-    tmp_path: Path,
-    allowed_chat_ids: str,
+    allowed_chat_ids: list[object],
 ) -> None:
     """allowed_chat_ids list 항목도 유효한 chat id만 허용해야 한다."""
-    (tmp_path / "dev.yaml").write_text(
-        f"""
-telegram:
-  enabled: true
-  bot_token: "token"
-  chat_id: "12345"
-  remote_control:
-    enabled: true
-    allowed_chat_ids: {allowed_chat_ids}
-""",
-        encoding="utf-8",
-    )
-
     with pytest.raises(
         ValueError,
         match="allowed_chat_ids must be a list of chat ids",
     ):
-        load_config(env="dev", config_dir=tmp_path)
+        load_config_from_mapping(_remote_control_config(allowed_chat_ids=allowed_chat_ids))
 
 
-def test_remote_control_rejects_unknown_command_key(tmp_path: Path) -> None:
+def test_remote_control_rejects_unknown_command_key() -> None:
     """remote_control.commands의 알 수 없는 키는 거부해야 한다."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-telegram:
-  enabled: true
-  bot_token: "token"
-  chat_id: "12345"
-  remote_control:
-    enabled: true
-    allowed_chat_ids:
-      - "12345"
-    commands:
-      relaod: true
-""",
-        encoding="utf-8",
-    )
-
     with pytest.raises(ValueError):
-        load_config(env="dev", config_dir=tmp_path)
+        load_config_from_mapping(_remote_control_config(commands={"relaod": True}))
 
 
-def test_remote_control_requires_telegram_enabled(tmp_path: Path) -> None:
+def test_remote_control_requires_telegram_enabled() -> None:
     """원격제어가 켜져 있으면 telegram.enabled도 켜져 있어야 한다."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-telegram:
-  enabled: false
-  bot_token: "token"
-  chat_id: "12345"
-  remote_control:
-    enabled: true
-    allowed_chat_ids:
-      - "12345"
-""",
-        encoding="utf-8",
-    )
-
     with pytest.raises(
         ValueError,
         match="telegram.enabled must be true when remote_control.enabled is true",
     ):
-        load_config(env="dev", config_dir=tmp_path)
+        load_config_from_mapping(_remote_control_config(telegram_enabled=False))
 
 
-def test_remote_control_requires_bot_token(tmp_path: Path) -> None:
+def test_remote_control_requires_bot_token() -> None:
     """원격제어가 켜져 있으면 bot_token이 비어 있으면 안 된다."""
-    (tmp_path / "dev.yaml").write_text(
-        """
-telegram:
-  enabled: true
-  bot_token: ""
-  chat_id: "12345"
-  remote_control:
-    enabled: true
-    allowed_chat_ids:
-      - "12345"
-""",
-        encoding="utf-8",
-    )
-
     with pytest.raises(
         ValueError,
         match="telegram.bot_token must not be empty when remote_control.enabled is true",
     ):
-        load_config(env="dev", config_dir=tmp_path)
+        load_config_from_mapping(_remote_control_config(bot_token=""))
+
+
+def test_load_config_returns_cached_settings_for_unchanged_file(tmp_path: Path) -> None:
+    """파일 내용이 같으면 YAML 재파싱 없이 캐시된 Settings를 반환해야 한다."""
+    clear_config_cache()
+    (tmp_path / "dev.yaml").write_text('app:\n  name: "cached"\n', encoding="utf-8")
+
+    with patch("src.utils.config.yaml.load", wraps=yaml.load) as mock_yaml_load:
+        first = load_config(env="dev", config_dir=tmp_path)
+        second = load_config(env="dev", config_dir=tmp_path)
+
+    mock_yaml_load.assert_called_once()
+    assert second == first
+
+
+def test_load_config_returns_independent_copies(tmp_path: Path) -> None:
+    """반환된 Settings를 수정해도 이후 load_config 결과에는 영향이 없어야 한다."""
+    clear_config_cache()
+    (tmp_path / "dev.yaml").write_text('app:\n  name: "cached"\n', encoding="utf-8")
+
+    first = load_config(env="dev", config_dir=tmp_path)
+    first.app.name = "mutated"
+    first.app.debug = True
+    second = load_config(env="dev", config_dir=tmp_path)
+
+    assert second is not first
+    assert second.app.name == "cached"
+    assert second.app.debug is False
+
+
+def test_load_config_reloads_when_file_content_changes(tmp_path: Path) -> None:
+    """파일 내용이 바뀌면 캐시를 사용하지 않고 새 설정을 로드해야 한다."""
+    config_file = tmp_path / "dev.yaml"
+    config_file.write_text('app:\n  name: "before"\n', encoding="utf-8")
+    first = load_config(env="dev", config_dir=tmp_path)
+
+    config_file.write_text('app:\n  name: "after!"\n', encoding="utf-8")
+    second = load_config(env="dev", config_dir=tmp_path)
+
+    assert first.app.name == "before"
+    assert second.app.name == "after!"
+
+
+def test_load_config_reloads_when_settings_env_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Settings에 영향을 주는 환경변수가 바뀌면 캐시를 사용하지 않아야 한다."""
+    (tmp_path / "dev.yaml").write_text("telegram:\n  enabled: false\n", encoding="utf-8")
+    monkeypatch.delenv("TELEGRAM__CHAT_ID", raising=False)
+    first = load_config(env="dev", config_dir=tmp_path)
+
+    monkeypatch.setenv("TELEGRAM__CHAT_ID", "98765")
+    second = load_config(env="dev", config_dir=tmp_path)
+
+    assert first.telegram.chat_id == ""
+    assert second.telegram.chat_id == "98765"
+
+
+def test_load_config_uses_project_config_dir_by_default() -> None:
+    """config_dir을 생략하면 프로젝트 루트의 config/ 디렉토리를 사용해야 한다."""
+    expected_dir = Path(__file__).parent.parent.parent / "config"
+
+    with pytest.raises(ConfigurationError, match=re.escape(str(expected_dir / "missing-env"))):
+        load_config(env="missing-env")
@@ -1,3 +1,6 @@
+from collections.abc import Callable, Iterable
+from unittest.mock import patch
+
 import httpx
 import pytest
 
@@ -7,18 +10,26 @@ from src.utils.http_client import HttpClient
 
 @pytest.mark.asyncio
 async def test_http_client_get() -> None:
-    async with HttpClient(base_url="https://httpbin.org") as client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"url": str(request.url)})
+
+    async with HttpClient(
+        base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+    ) as client:
         response = await client.get("/get")
         assert response.status_code == 200
         data = response.json()
-        assert "url" in data
+        assert data["url"] == "https://api.example.com/get"
 
 
 @pytest.mark.asyncio
 async def test_http_client_timeout() -> None:
-    async with HttpClient(timeout=0.001) as client:
-        with pytest.raises(HttpClientError):
-            await client.get("https://httpbin.org/delay/10")
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    async with HttpClient(timeout=0.001, transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(HttpClientError, match="ReadTimeout"):
+            await client.get("https://api.example.com/delay/10")
 
 
 @pytest.mark.asyncio
@@ -60,3 +71,65 @@ async def test_http_client_post_includes_response_body_in_error_message() -> Non
             match='HTTPStatusError: Bad Request - response=\\{"error":"invalid"\\}',
         ):
             await client.post("https://api.example.com/orders", json={"amount": 1})
+
+
+@pytest.mark.asyncio
+async def test_http_client_forwards_only_provided_request_arguments() -> None:
+    captured: list[dict[str, object]] = []
+    request = httpx.Request("POST", "https://api.example.com/orders")
+
+    async def record(url: str, **kwargs: object) -> httpx.Response:
+        captured.append(kwargs)
+        return httpx.Response(200, request=request)
+
+    async with HttpClient() as client:
+        assert client._client is not None
+        client._client.get = record  # type: ignore[method-assign]
+        client._client.post = record  # type: ignore[method-assign]
+
+        await client.get("https://api.example.com/orders")
+        await client.get("https://api.example.com/orders", params={"page": 1})
+        await client.post("https://api.example.com/orders", json={"amount": 1})
+
+    assert captured == [{}, {"params": {"page": 1}}, {"json": {"amount": 1}}]
+
+
+@pytest.mark.asyncio
+async def test_http_client_configures_connection_pool() -> None:
+    client = HttpClient(max_connections=64, max_keepalive_connections=64)
+
+    with patch("httpx.AsyncClient", wraps=httpx.AsyncClient) as mock_client_class:
+        async with client:
+            pass
+
+    kwargs = mock_client_class.call_args.kwargs
+    assert kwargs["limits"] == httpx.Limits(max_connections=64, max_keepalive_connections=64)
+    assert kwargs["http2"] is False
+
+
+@pytest.mark.asyncio
+async def test_http_client_reuses_injected_client_without_closing_it() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async with httpx.AsyncClient(
+        base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+    ) as shared:
+        async with HttpClient(client=shared) as first:
+            assert first._client is shared
+            response = await first.get("/first")
+        async with HttpClient(client=shared) as second:
+            assert second._client is shared
+            await second.get("/second")
+
+        assert response.json() == {"path": "/first"}
+        assert shared.is_closed is False
+
+    assert shared.is_closed is True
+
+
+def test_http_client_import_defers_httpx(
+    assert_not_imported: Callable[[str, Iterable[str]], None],
+) -> None:
+    """모듈 import만으로는 httpx를 로드하지 않아야 한다."""
+    assert_not_imported("import src.utils.http_client", ("httpx",))
@@ -1,8 +1,11 @@
-import os
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
 from loguru import logger
 
+from src.utils import logger as logger_module
 from src.utils.logger import (
     _build_console_format,
     _log_namer,
@@ -12,13 +15,32 @@ from src.utils.logger import (
 )
 
 
-def test_setup_logger_console_only(tmp_path: Path) -> None:
-    logger.remove()  # Clear existing handlers
+@pytest.fixture(autouse=True)
+def clean_logger(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """테스트마다 loguru 핸들러가 없는 상태에서 시작하고, 추가된 핸들러를 정리합니다."""
+    logger.remove()
+    monkeypatch.setattr(logger_module, "_HANDLER_IDS", {})
+    monkeypatch.setattr(logger_module, "_file_handler_config", None)
+    yield
+    logger.remove()
 
-    setup_logger(level="DEBUG", log_file=None, format_str="{level} | {message}")
 
-    # Logger should be configured
-    assert len(logger._core.handlers) > 0
+@pytest.mark.parametrize("log_file_name", [None, "test.log"])
+def test_setup_logger(tmp_path: Path, log_file_name: str | None) -> None:
+    log_file = tmp_path / log_file_name if log_file_name else None
+    setup_logger(
+        level="INFO",
+        log_file=log_file,
+        format_str="{level} | {message}",
+        rotation="1 MB",
+        retention="1 day",
+    )
+
+    # 콘솔 핸들러와 파일 핸들러(미지정 시 기본 경로)가 등록되어야 한다
+    assert len(logger._core.handlers) == 2
+    if log_file:
+        logger.info("test message")
+        assert "test message" in log_file.read_text()
 
 
 def test_build_console_format_applies_color_markup() -> None:
@@ -40,26 +62,6 @@ def test_build_console_format_keeps_json_logs_format() -> None:
     assert result == fmt
 
 
-def test_setup_logger_with_file(tmp_path: Path) -> None:
-    logger.remove()
-
-    log_file = tmp_path / "test.log"
-    setup_logger(
-        level="INFO",
-        log_file=log_file,
-        format_str="{level} | {message}",
-        rotation="1 MB",
-        retention="1 day",
-    )
-
-    # Log a message
-    logger.info("test message")
-
-    # File should be created
-    assert log_file.exists()
-    assert "test message" in log_file.read_text()
-
-
 def test_log_namer_converts_date_format() -> None:
     """로테이션된 로그 파일명이 .log_YYYYMMDD 형식으로 변환되는지 검증."""
     result = _log_namer("/logs/app.2026-02-06_00-00-00_000000.log")
@@ -117,8 +119,6 @@ def test_retention_handler_deletes_old_files(tmp_path: Path) -> None:
     # 오래된 백업 파일 생성 (30일 전)
     old_file = tmp_path / "app.log_20260101"
     old_file.write_text("very old")
-    # mtime을 과거로 설정
-    os.utime(old_file, (0, 0))
 
     handler([])
 
@@ -140,3 +140,75 @@ def test_retention_handler_keeps_recent_files(tmp_path: Path) -> None:
     handler([])
 
     assert recent_file.exists()
+
+
+def test_retention_handler_skips_invalid_date_stamp(tmp_path: Path) -> None:
+    """날짜로 해석할 수 없는 백업 파일명은 삭제하지 않아야 한다."""
+    log_file = tmp_path / "app.log"
+    handler = _make_retention_handler("1 day", log_file)
+
+    invalid_file = tmp_path / "app.log_20261399"
+    invalid_file.write_text("not a date")
+
+    handler([])
+
+    assert invalid_file.exists()
+
+
+def test_retention_handler_ignores_missing_log_dir(tmp_path: Path) -> None:
+    """로그 디렉토리가 없어도 retention 핸들러가 예외 없이 종료되어야 한다."""
+    handler = _make_retention_handler("1 day", tmp_path / "missing" / "app.log")
+
+    handler([])
+
+
+def test_setup_logger_reuses_file_handler_for_same_config(tmp_path: Path) -> None:
+    log_file = tmp_path / "reuse.log"
+
+    setup_logger(level="INFO", log_file=log_file, format_str="{message}")
+    file_handler_id = logger_module._HANDLER_IDS["file"]
+    with patch.object(logger, "add", wraps=logger.add) as mock_add:
+        setup_logger(level="INFO", log_file=log_file, format_str="{message}")
+
+    # 콘솔 핸들러만 다시 추가하고 파일 핸들러는 그대로 유지해야 한다
+    assert mock_add.call_count == 1
+    assert logger_module._HANDLER_IDS["file"] == file_handler_id
+    assert len(logger._core.handlers) == 2
+
+
+def test_setup_logger_replaces_file_handler_when_config_changes(tmp_path: Path) -> None:
+    first_file = tmp_path / "first.log"
+    second_file = tmp_path / "second.log"
+
+    setup_logger(level="INFO", log_file=first_file, format_str="{message}")
+    setup_logger(level="INFO", log_file=second_file, format_str="{message}")
+    logger.info("after switch")
+
+    assert len(logger._core.handlers) == 2
+    assert "after switch" not in first_file.read_text()
+    assert "after switch" in second_file.read_text()
+
+
+def test_setup_logger_recovers_after_external_remove(tmp_path: Path) -> None:
+    log_file = tmp_path / "external.log"
+    setup_logger(level="INFO", log_file=log_file, format_str="{message}")
+
+    logger.remove()
+    setup_logger(level="INFO", log_file=log_file, format_str="{message}")
+    logger.info("still logged")
+
+    assert "still logged" in log_file.read_text()
+    assert len(logger._core.handlers) == 2
+
+
+def test_setup_logger_keeps_handlers_added_elsewhere(tmp_path: Path) -> None:
+    captured: list[str] = []
+    external_id = logger.add(captured.append, format="{message}")
+    try:
+        setup_logger(level="INFO", log_file=tmp_path / "first.log", format_str="{message}")
+        setup_logger(level="DEBUG", log_file=tmp_path / "second.log", format_str="{message}")
+        logger.info("kept")
+    finally:
+        logger.remove(external_id)
+
+    assert any("kept" in message for message in captured)
@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.utils.rate_limiter import AsyncRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_calls_within_limit() -> None:
+    limiter = AsyncRateLimiter(max_rate=3, time_period=60.0)
+
+    with patch("src.utils.rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        for _ in range(3):
+            async with limiter:
+                pass
+
+    mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_when_limit_reached() -> None:
+    limiter = AsyncRateLimiter(max_rate=2, time_period=10.0)
+    clock = [100.0]
+
+    async def advance(seconds: float) -> None:
+        clock[0] += seconds
+
+    with (
+        patch("src.utils.rate_limiter.monotonic", side_effect=lambda: clock[0]),
+        patch("src.utils.rate_limiter.asyncio.sleep", side_effect=advance) as mock_sleep,
+    ):
+        await limiter.acquire()
+        clock[0] += 4.0
+        await limiter.acquire()
+        await limiter.acquire()
+
+    # 첫 호출(100.0)이 창을 벗어나는 110.0까지 6초를 대기해야 한다.
+    mock_sleep.assert_awaited_once_with(6.0)
+    assert clock[0] == 110.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_serializes_concurrent_waiters() -> None:
+    limiter = AsyncRateLimiter(max_rate=2, time_period=0.05)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+    assert loop.time() - started >= 0.05
+
+
+@pytest.mark.parametrize(("max_rate", "time_period"), [(0, 1.0), (1, 0.0)])
+def test_rate_limiter_rejects_invalid_arguments(max_rate: int, time_period: float) -> None:
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(max_rate=max_rate, time_period=time_period)
@@ -1,7 +1,20 @@
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from src.utils.exceptions import RetryExhaustedError
-from src.utils.retry import with_retry
+from src.utils.retry import with_retry, with_retry_async
+
+
+@pytest.fixture(autouse=True)
+def retry_sleeps() -> Iterator[tuple[MagicMock, AsyncMock]]:
+    """재시도 대기가 실제 시간을 쓰지 않도록 time.sleep/asyncio.sleep을 대체합니다."""
+    with (
+        patch("src.utils.retry.time.sleep") as mock_sleep,
+        patch("src.utils.retry.asyncio.sleep", new_callable=AsyncMock) as mock_async_sleep,
+    ):
+        yield mock_sleep, mock_async_sleep
 
 
 def test_retry_succeeds_on_first_attempt() -> None:
@@ -43,3 +56,119 @@ def test_retry_exhausted() -> None:
         always_fails()
 
     assert "permanent error" in str(exc_info.value)
+    assert isinstance(exc_info.value.__cause__, ValueError)
+
+
+def test_retry_waits_with_capped_exponential_backoff(
+    retry_sleeps: tuple[MagicMock, AsyncMock],
+) -> None:
+    """대기 시간은 2배씩 증가하되 max_wait_seconds를 넘지 않아야 한다."""
+
+    @with_retry(max_attempts=5, wait_seconds=1.0, max_wait_seconds=3.0)
+    def always_fails() -> str:
+        raise ValueError("permanent error")
+
+    mock_sleep, _ = retry_sleeps
+    with pytest.raises(RetryExhaustedError):
+        always_fails()
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0, 3.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_async_succeeds_after_failures(
+    retry_sleeps: tuple[MagicMock, AsyncMock],
+) -> None:
+    call_count = 0
+
+    @with_retry_async(max_attempts=3, wait_seconds=0.5)
+    async def fails_twice() -> str:
+        nonlocal call_count
+        call_count += 1
+        if call_count < 3:
+            raise ValueError("temporary error")
+        return "success"
+
+    _, mock_async_sleep = retry_sleeps
+    result = await fails_twice()
+
+    assert result == "success"
+    assert call_count == 3
+    assert [call.args[0] for call in mock_async_sleep.await_args_list] == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_async_exhausted() -> None:
+    @with_retry_async(max_attempts=2, wait_seconds=0.01)
+    async def always_fails() -> str:
+        raise ValueError("permanent error")
+
+    with pytest.raises(RetryExhaustedError, match="permanent error"):
+        await always_fails()
+
+
+def test_retry_does_not_retry_unlisted_exceptions() -> None:
+    """retry_on에 없는 예외는 재시도 없이 원본 그대로 전파되어야 한다."""
+    call_count = 0
+
+    @with_retry(max_attempts=3, wait_seconds=0.01, retry_on=ConnectionError)
+    def raises_type_error() -> str:
+        nonlocal call_count
+        call_count += 1
+        raise TypeError("programmer error")
+
+    with pytest.raises(TypeError, match="programmer error"):
+        raises_type_error()
+
+    assert call_count == 1
+
+
+def test_retry_retries_listed_exceptions() -> None:
+    call_count = 0
+
+    @with_retry(max_attempts=3, wait_seconds=0.01, retry_on=(ConnectionError, TimeoutError))
+    def fails_once() -> str:
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            raise TimeoutError("temporary")
+        return "success"
+
+    assert fails_once() == "success"
+
+    assert call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_async_does_not_retry_unlisted_exceptions() -> None:
+    mock_func = AsyncMock(side_effect=KeyError("missing"))
+    decorated = with_retry_async(max_attempts=3, retry_on=ConnectionError)(mock_func)
+
+    with pytest.raises(KeyError):
+        await decorated()
+
+    mock_func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_with_retry_awaits_coroutine_functions(
+    retry_sleeps: tuple[MagicMock, AsyncMock],
+) -> None:
+    """with_retry를 코루틴 함수에 적용하면 asyncio.sleep으로 대기해야 한다."""
+    call_count = 0
+
+    @with_retry(max_attempts=3, wait_seconds=0.5)
+    async def fails_once() -> str:
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            raise ValueError("temporary error")
+        return "success"
+
+    mock_sleep, mock_async_sleep = retry_sleeps
+    result = await fails_once()
+
+    assert result == "success"
+    assert call_count == 2
+    mock_async_sleep.assert_awaited_once_with(0.5)
+    mock_sleep.assert_not_called()
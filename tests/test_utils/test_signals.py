@@ -1,4 +1,7 @@
+import asyncio
+import os
 import signal
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -50,3 +53,234 @@ def test_setup_signal_handlers() -> None:
 
         # Should register SIGTERM and SIGINT
         assert mock_signal.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_setup_signal_handlers_uses_running_loop() -> None:
+    shutdown = GracefulShutdown()
+    loop = asyncio.get_running_loop()
+
+    with (
+        patch.object(loop, "add_signal_handler") as mock_add,
+        patch("signal.signal") as mock_signal,
+    ):
+        setup_signal_handlers(shutdown)
+
+    assert [c.args[0] for c in mock_add.call_args_list] == [signal.SIGTERM, signal.SIGINT]
+    mock_signal.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_setup_signal_handlers_falls_back_when_loop_unsupported() -> None:
+    shutdown = GracefulShutdown()
+    loop = asyncio.get_running_loop()
+
+    with (
+        patch.object(loop, "add_signal_handler", side_effect=NotImplementedError),
+        patch("signal.signal") as mock_signal,
+    ):
+        setup_signal_handlers(shutdown)
+
+    assert mock_signal.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_setup_signal_handlers_undoes_partial_loop_registration() -> None:
+    shutdown = GracefulShutdown()
+    loop = asyncio.get_running_loop()
+
+    with (
+        patch.object(loop, "add_signal_handler", side_effect=[None, NotImplementedError]),
+        patch.object(loop, "remove_signal_handler") as mock_remove,
+        patch("signal.signal") as mock_signal,
+    ):
+        setup_signal_handlers(shutdown)
+
+    mock_remove.assert_called_once_with(signal.SIGTERM)
+    assert mock_signal.call_count == 2
+    assert shutdown._signal_loop is None
+
+
+@pytest.mark.asyncio
+async def test_signal_wakes_shutdown_sleep() -> None:
+    shutdown = GracefulShutdown()
+    loop = asyncio.get_running_loop()
+    setup_signal_handlers(shutdown)
+    try:
+        loop.call_later(0.01, os.kill, os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(shutdown.sleep(5), timeout=1)
+    finally:
+        loop.remove_signal_handler(signal.SIGTERM)
+        loop.remove_signal_handler(signal.SIGINT)
+
+    assert shutdown.should_exit is True
+
+
+@pytest.mark.asyncio
+async def test_shutdown_sleep_propagates_external_cancel() -> None:
+    shutdown = GracefulShutdown()
+    task = asyncio.create_task(shutdown.sleep(5))
+    await asyncio.sleep(0)
+
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert shutdown.should_exit is False
+
+
+def test_restore_signal_handlers_reinstates_previous_handlers() -> None:
+    shutdown = GracefulShutdown()
+    original = {sig: signal.getsignal(sig) for sig in (signal.SIGTERM, signal.SIGINT)}
+
+    setup_signal_handlers(shutdown)
+    assert signal.getsignal(signal.SIGTERM) == shutdown._handle_signal
+
+    shutdown.restore_signal_handlers()
+
+    assert {sig: signal.getsignal(sig) for sig in original} == original
+
+
+@pytest.mark.asyncio
+async def test_restore_signal_handlers_reinstates_previous_handlers_on_loop_path() -> None:
+    shutdown = GracefulShutdown()
+    original = signal.getsignal(signal.SIGTERM)
+
+    def previous_handler(signum: int, frame: object) -> None:
+        del signum, frame
+
+    signal.signal(signal.SIGTERM, previous_handler)
+    try:
+        setup_signal_handlers(shutdown)
+        assert shutdown._signal_loop is asyncio.get_running_loop()
+
+        shutdown.restore_signal_handlers()
+
+        assert signal.getsignal(signal.SIGTERM) is previous_handler
+    finally:
+        signal.signal(signal.SIGTERM, original)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_context_removes_loop_signal_handlers() -> None:
+    shutdown = GracefulShutdown()
+    loop = asyncio.get_running_loop()
+
+    with (
+        patch.object(loop, "add_signal_handler"),
+        patch.object(loop, "remove_signal_handler") as mock_remove,
+    ):
+        setup_signal_handlers(shutdown)
+        async with shutdown:
+            pass
+
+    assert [c.args[0] for c in mock_remove.call_args_list] == [signal.SIGTERM, signal.SIGINT]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_wait_reports_timeout_and_exit_request() -> None:
+    shutdown = GracefulShutdown()
+
+    assert await shutdown.wait(timeout=0.01) is False
+
+    asyncio.get_running_loop().call_soon(shutdown._handle_signal, signal.SIGINT, None)
+
+    assert await shutdown.wait(timeout=1) is True
+    assert shutdown.should_exit is True
+
+
+@pytest.mark.asyncio
+async def test_cleanup_callbacks_run_concurrently_and_isolate_failures() -> None:
+    shutdown = GracefulShutdown()
+    both_started = asyncio.Event()
+    started: list[str] = []
+
+    async def slow_cleanup(name: str) -> None:
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        # 순차 실행이면 두 번째 콜백이 시작되지 않아 시간 초과된다.
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    async def failing_cleanup() -> None:
+        raise RuntimeError("cleanup failed")
+
+    shutdown.register_cleanup(lambda: slow_cleanup("first"))
+    shutdown.register_cleanup(failing_cleanup)
+    shutdown.register_cleanup(lambda: slow_cleanup("second"))
+    shutdown._handle_signal(signal.SIGTERM, None)
+
+    with patch("src.utils.signals.logger.error") as mock_error:
+        async with shutdown:
+            pass
+
+    assert started == ["first", "second"]
+    mock_error.assert_called_once()
+    message, error = mock_error.call_args.args
+    assert message == "Cleanup callback failed: {!r}"
+    assert isinstance(error, RuntimeError)
+    assert str(error) == "cleanup failed"
+
+
+@pytest.mark.asyncio
+async def test_cleanup_callback_cancelled_error_is_logged() -> None:
+    """BaseException(CancelledError)로 끝난 정리 콜백도 로그로 남겨야 한다."""
+    shutdown = GracefulShutdown()
+
+    async def cancelled_cleanup() -> None:
+        raise asyncio.CancelledError
+
+    shutdown.register_cleanup(cancelled_cleanup)
+    shutdown._handle_signal(signal.SIGTERM, None)
+
+    with patch("src.utils.signals.logger.error") as mock_error:
+        async with shutdown:
+            pass
+
+    mock_error.assert_called_once()
+    message, error = mock_error.call_args.args
+    assert message == "Cleanup callback failed: {!r}"
+    assert isinstance(error, asyncio.CancelledError)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_timeout_bounds_shutdown() -> None:
+    shutdown = GracefulShutdown(cleanup_timeout=0.01)
+    cancelled = False
+
+    async def hanging_cleanup() -> None:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    shutdown.register_cleanup(hanging_cleanup)
+    shutdown._handle_signal(signal.SIGTERM, None)
+
+    with patch("src.utils.signals.logger.error") as mock_error:
+        async with shutdown:
+            pass
+
+    assert cancelled is True
+    mock_error.assert_called_once_with("Cleanup callbacks timed out after {}s", 0.01)
+
+
+def test_setup_signal_handlers_skips_non_main_thread() -> None:
+    shutdown = GracefulShutdown()
+    errors: list[BaseException] = []
+
+    def register() -> None:
+        try:
+            setup_signal_handlers(shutdown)
+        except BaseException as exc:  # noqa: BLE001 - 스레드 예외를 테스트로 전달
+            errors.append(exc)
+
+    with patch("signal.signal") as mock_signal:
+        thread = threading.Thread(target=register)
+        thread.start()
+        thread.join()
+
+    assert errors == []
+    mock_signal.assert_not_called()
@@ -1,25 +1,54 @@
+import asyncio
+import contextlib
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from weakref import WeakValueDictionary
 from zoneinfo import ZoneInfo
 
 import pytest
-from telegram.error import TimedOut
+from telegram.error import RetryAfter, TimedOut
 
 from src.utils.config import TelegramSilentTimeConfig
+from src.utils.rate_limiter import AsyncRateLimiter
 from src.utils.telegram import TelegramNotifier
 
 
-@pytest.mark.asyncio
-async def test_telegram_send_message() -> None:
-    with (
-        patch("src.utils.telegram.Bot") as mock_bot_class,
-        patch("src.utils.telegram.logger.info") as mock_info,
-    ):
-        mock_bot = AsyncMock()
-        mock_bot_class.return_value = mock_bot
+@pytest.fixture(autouse=True)
+def reset_shared_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """공유 rate limiter/Bot 캐시 상태가 테스트 간에 누적되지 않도록 초기화합니다."""
+    monkeypatch.setattr(TelegramNotifier, "_global_limiter", AsyncRateLimiter(30, 1.0))
+    monkeypatch.setattr(TelegramNotifier, "_chat_limiters", {})
+    monkeypatch.setattr("src.utils.telegram._BOT_CACHE", WeakValueDictionary())
+
+
+@pytest.fixture
+def mock_bot_class() -> Iterator[MagicMock]:
+    """AsyncMock 봇을 반환하도록 대체한 telegram.Bot 클래스."""
+    with patch("telegram.Bot") as bot_class:
+        bot_class.return_value = AsyncMock()
+        yield bot_class
+
 
-        notifier = TelegramNotifier(bot_token="test-token", chat_id="12345", enabled=True)
-        await notifier.send_message("test message")
+@pytest.fixture
+def mock_bot(mock_bot_class: MagicMock) -> AsyncMock:
+    """telegram.Bot 생성 시 반환되는 AsyncMock 봇."""
+    bot: AsyncMock = mock_bot_class.return_value
+    return bot
+
+
+@pytest.fixture
+def telegram_notifier(mock_bot: AsyncMock) -> TelegramNotifier:
+    """mock_bot으로 전송하는 활성화된 TelegramNotifier."""
+    return TelegramNotifier(bot_token="test-token", chat_id="12345", enabled=True)
+
+
+@pytest.mark.asyncio
+async def test_telegram_send_message(
+    telegram_notifier: TelegramNotifier, mock_bot: AsyncMock
+) -> None:
+    with patch("src.utils.telegram.logger.info") as mock_info:
+        await telegram_notifier.send_message("test message")
 
         mock_bot.send_message.assert_called_once_with(
             chat_id="12345", text="test message", parse_mode=None
@@ -40,57 +69,46 @@ async def test_telegram_disabled() -> None:
 
 
 @pytest.mark.asyncio
-async def test_telegram_error_handling() -> None:
-    with patch("src.utils.telegram.Bot") as mock_bot_class:
-        mock_bot = AsyncMock()
-        mock_bot.send_message.side_effect = Exception("API error")
-        mock_bot_class.return_value = mock_bot
+async def test_telegram_error_handling(
+    telegram_notifier: TelegramNotifier, mock_bot: AsyncMock
+) -> None:
+    mock_bot.send_message.side_effect = Exception("API error")
 
-        notifier = TelegramNotifier(bot_token="test-token", chat_id="12345", enabled=True)
-
-        # Should not raise, just log error
-        await notifier.send_message("test")
+    # Should not raise, just log error
+    await telegram_notifier.send_message("test")
 
 
 @pytest.mark.asyncio
-async def test_telegram_timeout_is_warning_not_error() -> None:
+async def test_telegram_timeout_is_warning_not_error(
+    telegram_notifier: TelegramNotifier, mock_bot: AsyncMock
+) -> None:
+    mock_bot.send_message.side_effect = TimedOut("Timed out")
     with (
-        patch("src.utils.telegram.Bot") as mock_bot_class,
         patch("src.utils.telegram.logger.warning") as mock_warning,
         patch("src.utils.telegram.logger.error") as mock_error,
     ):
-        mock_bot = AsyncMock()
-        mock_bot.send_message.side_effect = TimedOut("Timed out")
-        mock_bot_class.return_value = mock_bot
-
-        notifier = TelegramNotifier(bot_token="test-token", chat_id="12345", enabled=True)
-        await notifier.send_message("test")
+        await telegram_notifier.send_message("test")
 
     mock_warning.assert_called_once()
     mock_error.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_telegram_send_message_skipped_during_silent_time() -> None:
-    with (
-        patch("src.utils.telegram.Bot") as mock_bot_class,
-        patch("src.utils.telegram.logger.info") as mock_info,
-    ):
-        mock_bot = AsyncMock()
-        mock_bot_class.return_value = mock_bot
-        notifier = TelegramNotifier(
-            bot_token="test-token",
-            chat_id="12345",
+async def test_telegram_send_message_skipped_during_silent_time(mock_bot: AsyncMock) -> None:
+    notifier = TelegramNotifier(
+        bot_token="test-token",
+        chat_id="12345",
+        enabled=True,
+        silent_time=TelegramSilentTimeConfig(
             enabled=True,
-            silent_time=TelegramSilentTimeConfig(
-                enabled=True,
-                start="23:00",
-                end="08:00",
-                timezone="Asia/Seoul",
-            ),
-            now_provider=lambda: datetime(2026, 3, 14, 23, 30, tzinfo=ZoneInfo("Asia/Seoul")),
-        )
+            start="23:00",
+            end="08:00",
+            timezone="Asia/Seoul",
+        ),
+        now_provider=lambda: datetime(2026, 3, 14, 23, 30, tzinfo=ZoneInfo("Asia/Seoul")),
+    )
 
+    with patch("src.utils.telegram.logger.info") as mock_info:
         result = await notifier.send_message("test message")
 
     assert result is False
@@ -104,24 +122,21 @@ async def test_telegram_send_message_skipped_during_silent_time() -> None:
 
 
 @pytest.mark.asyncio
-async def test_telegram_send_message_allows_outside_silent_time() -> None:
-    with patch("src.utils.telegram.Bot") as mock_bot_class:
-        mock_bot = AsyncMock()
-        mock_bot_class.return_value = mock_bot
-        notifier = TelegramNotifier(
-            bot_token="test-token",
-            chat_id="12345",
+async def test_telegram_send_message_allows_outside_silent_time(mock_bot: AsyncMock) -> None:
+    notifier = TelegramNotifier(
+        bot_token="test-token",
+        chat_id="12345",
+        enabled=True,
+        silent_time=TelegramSilentTimeConfig(
             enabled=True,
-            silent_time=TelegramSilentTimeConfig(
-                enabled=True,
-                start="23:00",
-                end="08:00",
-                timezone="Asia/Seoul",
-            ),
-            now_provider=lambda: datetime(2026, 3, 14, 12, 0, tzinfo=ZoneInfo("Asia/Seoul")),
-        )
+            start="23:00",
+            end="08:00",
+            timezone="Asia/Seoul",
+        ),
+        now_provider=lambda: datetime(2026, 3, 14, 12, 0, tzinfo=ZoneInfo("Asia/Seoul")),
+    )
 
-        result = await notifier.send_message("test message")
+    result = await notifier.send_message("test message")
 
     assert result is True
     mock_bot.send_message.assert_called_once_with(
@@ -129,6 +144,169 @@ async def test_telegram_send_message_allows_outside_silent_time() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_telegram_bot_is_created_on_first_send_and_reused(mock_bot_class: MagicMock) -> None:
+    notifier = TelegramNotifier(bot_token="test-token", chat_id="12345", enabled=True)
+
+    mock_bot_class.assert_not_called()
+
+    await notifier.send_message("first")
+    await notifier.send_message("second")
+
+    mock_bot_class.assert_called_once_with(token="test-token")
+
+
+@pytest.mark.asyncio
+@pytest.mark.filterwarnings("ignore:.*retry_after.*:DeprecationWarning")
+async def test_telegram_retry_after_waits_and_resends_once(
+    telegram_notifier: TelegramNotifier, mock_bot: AsyncMock
+) -> None:
+    mock_bot.send_message.side_effect = [RetryAfter(3), None]
+    with patch("src.utils.telegram.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await telegram_notifier.send_message("test message")
+
+    assert result is True
+    assert mock_bot.send_message.await_count == 2
+    mock_sleep.assert_awaited_once_with(3.0)
+
+
+def test_telegram_notifiers_share_chat_rate_limiter() -> None:
+    first = TelegramNotifier(bot_token="test-token", chat_id="12345", enabled=True)
+    second = TelegramNotifier(bot_token="other-token", chat_id="12345", enabled=True)
+    other_chat = TelegramNotifier(bot_token="test-token", chat_id="67890", enabled=True)
+
+    assert first._chat_limiter() is second._chat_limiter()
+    assert first._chat_limiter() is not other_chat._chat_limiter()
+
+
+def test_telegram_per_chat_rate_is_configurable() -> None:
+    group = TelegramNotifier(bot_token="test-token", chat_id="-100999", enabled=True)
+    private = TelegramNotifier(
+        bot_token="test-token",
+        chat_id="12345",
+        enabled=True,
+        per_chat_rate=TelegramNotifier.PRIVATE_CHAT_RATE,
+    )
+
+    assert (group._chat_limiter().max_rate, group._chat_limiter().time_period) == (20, 60.0)
+    assert (private._chat_limiter().max_rate, private._chat_limiter().time_period) == (1, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_telegram_chat_waiting_on_its_limit_does_not_hold_global_slot(
+    mock_bot: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """채팅별 한도에 걸린 전송이 전체 한도 슬롯을 잡고 다른 채팅을 막지 않아야 한다."""
+    monkeypatch.setattr(TelegramNotifier, "_global_limiter", AsyncRateLimiter(2, 60.0))
+    busy = TelegramNotifier(
+        bot_token="test-token", chat_id="busy", enabled=True, per_chat_rate=(1, 60.0)
+    )
+    other = TelegramNotifier(bot_token="test-token", chat_id="other", enabled=True)
+
+    assert await busy.send_message("first") is True
+    blocked = asyncio.create_task(busy.send_message("second"))
+    await asyncio.sleep(0)
+
+    try:
+        assert await asyncio.wait_for(other.send_message("other"), timeout=1) is True
+    finally:
+        blocked.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await blocked
+
+    sent_chats = [call.kwargs["chat_id"] for call in mock_bot.send_message.await_args_list]
+    assert sent_chats == ["busy", "other"]
+
+
+@pytest.mark.asyncio
+async def test_telegram_queue_message_coalesces_into_single_send(mock_bot: AsyncMock) -> None:
+    notifier = TelegramNotifier(
+        bot_token="test-token", chat_id="12345", enabled=True, batch_window=0.05
+    )
+
+    notifier.queue_message("first")
+    notifier.queue_message("second")
+    await notifier.flush()
+
+    mock_bot.send_message.assert_awaited_once_with(
+        chat_id="12345", text="first\n---\nsecond", parse_mode=None
+    )
+    assert notifier._drain_task is None
+
+
+@pytest.mark.asyncio
+async def test_telegram_queue_message_splits_batches_over_length_limit(mock_bot: AsyncMock) -> None:
+    notifier = TelegramNotifier(
+        bot_token="test-token", chat_id="12345", enabled=True, batch_window=0.05
+    )
+
+    notifier.queue_message("a" * 3000)
+    notifier.queue_message("b" * 3000)
+    await notifier.flush()
+
+    sent_texts = [call.kwargs["text"] for call in mock_bot.send_message.await_args_list]
+    assert sent_texts == ["a" * 3000, "b" * 3000]
+
+
+@pytest.mark.asyncio
+async def test_telegram_queue_drain_task_finishes_without_flush(mock_bot: AsyncMock) -> None:
+    """flush를 호출하지 않아도 큐가 비면 백그라운드 전송 작업이 스스로 끝나야 한다."""
+    notifier = TelegramNotifier(
+        bot_token="test-token", chat_id="12345", enabled=True, batch_window=0.01
+    )
+
+    notifier.queue_message("unflushed")
+    drain_task = notifier._drain_task
+    assert drain_task is not None
+    await asyncio.wait_for(drain_task, timeout=1.0)
+
+    mock_bot.send_message.assert_awaited_once_with(
+        chat_id="12345", text="unflushed", parse_mode=None
+    )
+    notifier.queue_message("restarted")
+    assert notifier._drain_task is not drain_task
+    await notifier.flush()
+    assert mock_bot.send_message.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_telegram_context_manager_flushes_queue(mock_bot: AsyncMock) -> None:
+    """async with 블록을 벗어나면 큐에 남은 메시지를 전송해야 한다."""
+    async with TelegramNotifier(
+        bot_token="test-token", chat_id="12345", enabled=True, batch_window=0.05
+    ) as notifier:
+        notifier.queue_message("queued")
+
+    mock_bot.send_message.assert_awaited_once_with(chat_id="12345", text="queued", parse_mode=None)
+    assert notifier._drain_task is None
+
+
+@pytest.mark.asyncio
+async def test_telegram_queue_message_skipped_when_disabled() -> None:
+    notifier = TelegramNotifier(bot_token="", chat_id="", enabled=False)
+
+    notifier.queue_message("ignored")
+    await notifier.flush()
+
+    assert notifier._drain_task is None
+
+
+@pytest.mark.asyncio
+async def test_telegram_notifiers_share_bot_per_token(mock_bot_class: MagicMock) -> None:
+    mock_bot_class.side_effect = lambda token: AsyncMock(token=token)
+    first = TelegramNotifier(bot_token="test-token", chat_id="12345", enabled=True)
+    second = TelegramNotifier(bot_token="test-token", chat_id="67890", enabled=True)
+    other = TelegramNotifier(bot_token="other-token", chat_id="12345", enabled=True)
+
+    await first.send_message("first")
+    await second.send_message("second")
+    await other.send_message("other")
+
+    assert first._bot is second._bot
+    assert first._bot is not other._bot
+    assert mock_bot_class.call_count == 2
+
+
 def test_telegram_notifier_rejects_templates_argument() -> None:
     with pytest.raises(TypeError):
         TelegramNotifier(
@@ -163,3 +341,14 @@ def test_format_status_message_wraps_unbracketed_app_name() -> None:
 def test_format_status_message_with_batch_status() -> None:
     message = TelegramNotifier.format_status_message("j-upbit", "batch completed", reason="done")
     assert message == "[J-UPBIT] ✅ batch completed\nReason : done"
+
+
+def test_disabled_notifier_does_not_import_telegram(
+    assert_not_imported: Callable[[str, Iterable[str]], None],
+) -> None:
+    """알림이 비활성화되면 python-telegram-bot을 import하지 않아야 한다."""
+    assert_not_imported(
+        "from src.utils.telegram import TelegramNotifier; "
+        "TelegramNotifier(bot_token='', chat_id='', enabled=False)",
+        ("telegram",),
+    )